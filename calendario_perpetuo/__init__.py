@@ -0,0 +1,21 @@
+"""
+Perpetual calendar: 52 weeks of 7 days in 4 seasons of 13 weeks, plus the
+Year Day (Dec 21) and, in leap years, the Leap Day (June 21).
+
+Importing the package only defines the conversion engine in `core` (and the
+instrumentation flag it checks); the other modules (names, entries, compact,
+vectorized, table, solstice, search, recurrence, export, parallel, cli) are
+imported on demand.
+"""
+
+from .core import (
+    LEAP_DAY, NO_EXTRA_DAY, YEAR_DAY, PerpetualDate, PerpetualRange, YearLayout,
+    configure_layout_cache, from_perpetual, from_perpetual_many, is_leap_year_gregorian,
+    iter_perpetual_dates, layout_cache_info, to_perpetual, year_layout,
+)
+
+__all__ = [
+    "LEAP_DAY", "NO_EXTRA_DAY", "YEAR_DAY", "PerpetualDate", "PerpetualRange", "YearLayout",
+    "configure_layout_cache", "from_perpetual", "from_perpetual_many", "is_leap_year_gregorian",
+    "iter_perpetual_dates", "layout_cache_info", "to_perpetual", "year_layout",
+]
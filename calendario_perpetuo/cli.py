@@ -0,0 +1,164 @@
+"""
+Command-line interface:
+
+    calendario-perpetuo convert 2025-12-22 [--scheme constellation]
+    calendario-perpetuo gregorian 2031 3 7 3
+    calendario-perpetuo --solstice Europe/Madrid convert 2025-12-22
+    calendario-perpetuo dump 2025-12-21 2029-12-21 [--format text] [--output PATH] [--workers N]
+    calendario-perpetuo schemes
+    calendario-perpetuo --profile stats.json dump 1600-01-01 2600-01-01 --output calendar.txt
+
+Only argparse and the core engine are imported at startup; the export machinery
+is imported when a range is dumped.
+"""
+
+import argparse
+import datetime
+import sys
+
+from .core import LEAP_DAY, NO_EXTRA_DAY, YEAR_DAY, from_perpetual, to_perpetual
+
+EXTRA_DAY_ARGS = {"year-day": YEAR_DAY, "leap-day": LEAP_DAY}
+
+
+def _date(text):
+    try:
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an ISO date (YYYY-MM-DD): {text!r}") from None
+
+
+def _conversions(args):
+    """
+    Returns the to_perpetual and from_perpetual functions selected by --solstice.
+    """
+    if args.solstice is None:
+        return to_perpetual, from_perpetual
+    from .solstice import solstice_calendar
+    calendar = solstice_calendar(args.solstice)
+    return calendar.to_perpetual, calendar.from_perpetual
+
+
+def _convert(args):
+    from .names import get_names
+
+    to_perpetual, _ = _conversions(args)
+    names = get_names(args.scheme)
+    day_names, season_names = names.day_names, names.season_names
+    extra_day_labels = names.extra_day_labels
+    for date in args.dates:
+        perpetual_date = to_perpetual(date)
+        if perpetual_date.extra_day != NO_EXTRA_DAY:
+            text = extra_day_labels[perpetual_date.extra_day]
+        else:
+            text = (
+                f"{day_names[perpetual_date.day]}, {season_names[perpetual_date.season]} "
+                f"Week {perpetual_date.week_in_season}"
+            )
+        print(f"{date.isoformat()}  {text} ({perpetual_date.year})")
+    return 0
+
+
+def _gregorian(args):
+    _, from_perpetual = _conversions(args)
+    if args.season in EXTRA_DAY_ARGS:
+        date = from_perpetual(args.year, extra_day=EXTRA_DAY_ARGS[args.season])
+    else:
+        if args.week is None or args.day is None:
+            print("error: a regular day needs SEASON WEEK DAY", file=sys.stderr)
+            return 2
+        date = from_perpetual(args.year, int(args.season), args.week, args.day)
+    print(date.isoformat())
+    return 0
+
+
+def _dump(args):
+    if args.solstice is not None:
+        print("error: --solstice is not supported by dump", file=sys.stderr)
+        return 2
+    if args.workers is not None:
+        from .parallel import export_range_parallel
+        export_range_parallel(args.output, args.start, args.end, args.format, args.scheme, args.workers)
+    else:
+        from .export import export_range
+        export_range(args.output, args.start, args.end, args.format, args.scheme)
+    return 0
+
+
+def _schemes(args):
+    from .names import scheme_names
+
+    for scheme in scheme_names():
+        print(scheme)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="calendario-perpetuo", description="Perpetual calendar conversions.")
+    parser.add_argument("--scheme", default="latin",
+                        help="naming scheme, see the schemes command (default: latin)")
+    parser.add_argument("--solstice", metavar="TZ",
+                        help="anchor the Year Day and Leap Day on the solstices in time zone TZ "
+                             "(e.g. UTC, America/Argentina/Buenos_Aires; years 1600-2600)")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write counters, timings and cache hit rates as JSON to PATH (- for stderr)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="convert Gregorian dates to the perpetual calendar")
+    convert.add_argument("dates", nargs="+", type=_date, metavar="DATE")
+    convert.set_defaults(run=_convert)
+
+    gregorian = commands.add_parser("gregorian", help="convert a perpetual date to a Gregorian date")
+    gregorian.add_argument("year", type=int)
+    gregorian.add_argument("season", help="season index 0-3, or year-day / leap-day")
+    gregorian.add_argument("week", type=int, nargs="?", help="week in season, 1-13")
+    gregorian.add_argument("day", type=int, nargs="?", help="day index 0-6 (0 is Solis)")
+    gregorian.set_defaults(run=_gregorian)
+
+    dump = commands.add_parser("dump", help="export a range of dates")
+    dump.add_argument("start", type=_date)
+    dump.add_argument("end", type=_date)
+    dump.add_argument("--format", default="text", choices=["text", "csv", "jsonl", "ics"])
+    dump.add_argument("--output", default="-", help="output path (default: stdout)")
+    dump.add_argument("--workers", type=int, help="render on this many worker processes")
+    dump.set_defaults(run=_dump)
+
+    schemes = commands.add_parser("schemes", help="list the registered naming schemes")
+    schemes.set_defaults(run=_schemes)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.profile is None:
+        return _run(args)
+
+    import json
+    from . import instrument
+
+    with instrument.profile() as stats:
+        status = _run(args)
+    text = json.dumps(stats.snapshot, indent=2)
+    if args.profile == "-":
+        print(text, file=sys.stderr)
+        return status
+    try:
+        with open(args.profile, "w") as f:
+            f.write(text + "\n")
+    except OSError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    return status
+
+
+def _run(args):
+    try:
+        return args.run(args)
+    except (ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
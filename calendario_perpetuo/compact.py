@@ -0,0 +1,162 @@
+import array
+import datetime
+import functools
+
+from .core import (
+    DAYS_PER_WEEK, LEAP_DAY, LEAP_DAY_OFFSET, NO_EXTRA_DAY, REGULAR_DAYS_PER_YEAR,
+    WEEKS_PER_SEASON, YEAR_DAY, is_leap_year_gregorian, to_perpetual,
+    year_start_ordinal,
+)
+from .names import DEFAULT_SCHEME, resolve_names
+
+
+class PerpetualDay:
+    """
+    Compact record for a single day: the Gregorian ordinal plus small-int codes.
+    Season, week_in_season and day are -1 on extra days.
+    Names are only looked up when rendering. Records are immutable, so they
+    can be used in sets and as dict keys.
+    """
+
+    __slots__ = ("ordinal", "year", "season", "week_in_season", "day", "extra_day")
+
+    def __init__(self, ordinal, year, season, week_in_season, day, extra_day):
+        set_field = object.__setattr__ # __setattr__ below refuses every assignment
+        set_field(self, "ordinal", ordinal)
+        set_field(self, "year", year)
+        set_field(self, "season", season)
+        set_field(self, "week_in_season", week_in_season)
+        set_field(self, "day", day)
+        set_field(self, "extra_day", extra_day)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"PerpetualDay is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"PerpetualDay is immutable, cannot delete {name!r}")
+
+    def __reduce__(self):
+        return PerpetualDay, tuple(getattr(self, name) for name in self.__slots__)
+
+    @classmethod
+    def from_date(cls, date):
+        perpetual_date = to_perpetual(date)
+        if perpetual_date.extra_day != NO_EXTRA_DAY:
+            return cls(date.toordinal(), perpetual_date.year, -1, -1, -1, perpetual_date.extra_day)
+        return cls(date.toordinal(), *perpetual_date)
+
+    @property
+    def date(self):
+        return datetime.date.fromordinal(self.ordinal)
+
+    def render(self, names=DEFAULT_SCHEME):
+        """
+        Renders the perpetual date with a naming scheme (or a CalendarNames).
+        """
+        names = resolve_names(names)
+        if self.extra_day != NO_EXTRA_DAY:
+            return names.extra_day_labels[self.extra_day]
+        return f"{names.day_names[self.day]} {names.season_names[self.season]} Week {self.week_in_season}"
+
+    def __eq__(self, other):
+        if not isinstance(other, PerpetualDay):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"PerpetualDay({fields})"
+
+
+@functools.cache
+def _year_pattern(leap):
+    """
+    Season, week_in_season, day and extra_day codes for every day of a perpetual year,
+    built the first time a common or leap year is needed.
+    """
+    seasons = array.array("b")
+    weeks = array.array("b")
+    days = array.array("b")
+    extra_days = array.array("b")
+    for offset in range(REGULAR_DAYS_PER_YEAR):
+        if leap and offset == LEAP_DAY_OFFSET:
+            seasons.append(-1)
+            weeks.append(-1)
+            days.append(-1)
+            extra_days.append(LEAP_DAY)
+        week, day = divmod(offset, DAYS_PER_WEEK)
+        season, week_in_season = divmod(week, WEEKS_PER_SEASON)
+        seasons.append(season)
+        weeks.append(week_in_season + 1)
+        days.append(day)
+        extra_days.append(NO_EXTRA_DAY)
+    seasons.append(-1)
+    weeks.append(-1)
+    days.append(-1)
+    extra_days.append(YEAR_DAY)
+    return seasons, weeks, days, extra_days
+
+
+class PerpetualColumns:
+    """
+    Struct-of-arrays storage for the dates from start_date to end_date (inclusive).
+    Every column is an array of small ints (2 bytes for the year, 1 byte for the rest),
+    filled year by year from precomputed patterns rather than day by day.
+    """
+
+    def __init__(self, start_date, end_date):
+        self.start_ordinal = start_date.toordinal()
+        stop_ordinal = end_date.toordinal() + 1
+
+        self.year = array.array("h")
+        self.season = array.array("b")
+        self.week_in_season = array.array("b")
+        self.day = array.array("b")
+        self.extra_day = array.array("b")
+        columns = (self.season, self.week_in_season, self.day, self.extra_day)
+
+        if stop_ordinal <= self.start_ordinal:
+            return
+        year = to_perpetual(start_date).year
+        while year_start_ordinal(year) < stop_ordinal:
+            year_start = year_start_ordinal(year)
+            pattern = _year_pattern(is_leap_year_gregorian(year))
+            first = max(self.start_ordinal - year_start, 0)
+            last = min(stop_ordinal - year_start, len(pattern[0]))
+            self.year.extend(array.array("h", [year]) * (last - first))
+            for column, values in zip(columns, pattern):
+                column.extend(values[first:last])
+            year += 1
+
+    def __len__(self):
+        return len(self.extra_day)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            raise TypeError("PerpetualColumns does not support slicing")
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PerpetualColumns index out of range")
+        return PerpetualDay(
+            self.start_ordinal + index, self.year[index], self.season[index],
+            self.week_in_season[index], self.day[index], self.extra_day[index],
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self):
+        """
+        Bytes used by the column buffers.
+        """
+        columns = (self.year, self.season, self.week_in_season, self.day, self.extra_day)
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def render(self, index, names=DEFAULT_SCHEME):
+        return self[index].render(names)
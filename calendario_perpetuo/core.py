@@ -0,0 +1,277 @@
+import collections
+import datetime
+import functools
+import time
+
+from . import instrument
+
+# Layout of a perpetual year:
+# 52 weeks of 7 days, grouped in 4 seasons of 13 weeks (364 regular days),
+# plus the Year Day (Dec 21) closing the year, and the Leap Day (June 21)
+# inserted between the second and third seasons in Gregorian leap years.
+DAYS_PER_WEEK = 7
+WEEKS_PER_SEASON = 13
+SEASONS_PER_YEAR = 4
+DAYS_PER_SEASON = DAYS_PER_WEEK * WEEKS_PER_SEASON # 91
+REGULAR_DAYS_PER_YEAR = DAYS_PER_SEASON * SEASONS_PER_YEAR # 364
+
+# Offset (from the first day of the year) of the Leap Day, June 21.
+# Dec 22 -> June 20 is always 182 days in a leap year, so the Leap Day
+# falls right after the last day of the second season.
+LEAP_DAY_OFFSET = 2 * DAYS_PER_SEASON # 182
+
+# Days from Dec 22 (first day of the perpetual year) to the following Jan 1
+YEAR_START_TO_JAN_1 = 10
+
+# Extra-day codes
+NO_EXTRA_DAY = 0
+YEAR_DAY = 1
+LEAP_DAY = 2
+
+# A date in the perpetual calendar, using indices instead of names:
+#   year            perpetual year; year Y runs from Dec 22 of Y-1 to Dec 21 of Y
+#   season          0-3, or None for extra days
+#   week_in_season  1-13, or None for extra days
+#   day             0-6 (Solis .. Ignis), or None for extra days
+#   extra_day       NO_EXTRA_DAY, YEAR_DAY or LEAP_DAY
+PerpetualDate = collections.namedtuple(
+    "PerpetualDate", ["year", "season", "week_in_season", "day", "extra_day"]
+)
+
+def is_leap_year_gregorian(year):
+    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+
+
+def days_before_year(year):
+    """
+    Returns the number of days before Jan 1 of the given Gregorian year,
+    so that Jan 1 has ordinal days_before_year(year) + 1, as in date.toordinal().
+    """
+    y = year - 1
+    return y * 365 + y // 4 - y // 100 + y // 400
+
+
+def year_start_ordinal(year):
+    """
+    Returns the ordinal of the first day (Dec 22 of the previous Gregorian year)
+    of the given perpetual year.
+    """
+    return days_before_year(year) + 1 - YEAR_START_TO_JAN_1
+
+
+# Where a perpetual year falls in the Gregorian calendar, as ordinals:
+#   year            perpetual year
+#   start           first day (Dec 22 of the previous Gregorian year)
+#   leap_day        the Leap Day (June 21), or None in common years
+#   year_day        the Year Day (Dec 21), last day of the year
+#   season_starts   first day of each of the 4 seasons
+YearLayout = collections.namedtuple(
+    "YearLayout", ["year", "start", "leap_day", "year_day", "season_starts"]
+)
+
+
+def layout_from_anchors(year, start, leap_day, year_day):
+    """
+    Builds the YearLayout of a year from the ordinals of its first day, its
+    Leap Day (None in common years) and its Year Day.
+    """
+    season_starts = tuple(start + season * DAYS_PER_SEASON for season in range(SEASONS_PER_YEAR))
+    if leap_day is not None:
+        # Seasons starting after the Leap Day are pushed back by one day
+        season_starts = tuple(s + (s >= leap_day) for s in season_starts)
+    return YearLayout(year, start, leap_day, year_day, season_starts)
+
+
+def build_year_layout(year):
+    """
+    Computes the YearLayout of the given perpetual year.
+    """
+    start = year_start_ordinal(year)
+    leap_day = None
+    if is_leap_year_gregorian(year):
+        leap_day = start + LEAP_DAY_OFFSET
+    year_day = start + REGULAR_DAYS_PER_YEAR + (leap_day is not None)
+    return layout_from_anchors(year, start, leap_day, year_day)
+
+
+DEFAULT_LAYOUT_CACHE_SIZE = 64
+
+_cached_year_layout = functools.lru_cache(maxsize=DEFAULT_LAYOUT_CACHE_SIZE)(build_year_layout)
+
+
+def year_layout(year):
+    """
+    Returns the YearLayout of the given perpetual year from a bounded LRU cache.
+    """
+    return _cached_year_layout(year)
+
+
+def configure_layout_cache(maxsize=DEFAULT_LAYOUT_CACHE_SIZE):
+    """
+    Replaces the year layout cache with an empty one holding up to maxsize years
+    (None for unbounded, 0 to disable caching).
+    """
+    global _cached_year_layout
+    _cached_year_layout = functools.lru_cache(maxsize=maxsize)(build_year_layout)
+
+
+def layout_cache_info():
+    """
+    Returns the hits, misses, maxsize and currsize of the year layout cache.
+    """
+    return _cached_year_layout.cache_info()
+
+
+def perpetual_year_of(date):
+    """
+    Returns the perpetual year that contains the given Gregorian date.
+    """
+    if date.month == 12 and date.day >= 22:
+        return date.year + 1
+    return date.year
+
+
+def perpetual_date_in(layout, ordinal):
+    """
+    Returns the PerpetualDate of a date ordinal within the given YearLayout.
+    """
+    if ordinal == layout.year_day:
+        return PerpetualDate(layout.year, None, None, None, YEAR_DAY)
+    offset = ordinal - layout.start
+    if layout.leap_day is not None:
+        if ordinal == layout.leap_day:
+            return PerpetualDate(layout.year, None, None, None, LEAP_DAY)
+        if ordinal > layout.leap_day:
+            offset -= 1 # The Leap Day is outside the 364-day count
+
+    week, day = divmod(offset, DAYS_PER_WEEK)
+    season, week_in_season = divmod(week, WEEKS_PER_SEASON)
+    return PerpetualDate(layout.year, season, week_in_season + 1, day, NO_EXTRA_DAY)
+
+
+def to_perpetual(date):
+    """
+    Converts a Gregorian date to a PerpetualDate in constant time.
+    """
+    if instrument.enabled:
+        t0 = time.perf_counter_ns()
+        result = perpetual_date_in(_cached_year_layout(perpetual_year_of(date)), date.toordinal())
+        instrument.observe("convert.to_perpetual", time.perf_counter_ns() - t0)
+        return result
+    return perpetual_date_in(_cached_year_layout(perpetual_year_of(date)), date.toordinal())
+
+
+def ordinal_in(layout, season=None, week_in_season=None, day=None, extra_day=NO_EXTRA_DAY):
+    """
+    Returns the date ordinal of a perpetual date within the given YearLayout,
+    raising ValueError on invalid fields.
+    """
+    if extra_day == YEAR_DAY:
+        return layout.year_day
+    if extra_day == LEAP_DAY:
+        if layout.leap_day is None:
+            raise ValueError(f"Perpetual year {layout.year} has no Leap Day")
+        return layout.leap_day
+    if extra_day != NO_EXTRA_DAY:
+        raise ValueError(f"Unknown extra day code: {extra_day!r}")
+
+    if season is None or week_in_season is None or day is None:
+        raise ValueError("Regular days need a season, week_in_season and day")
+    if not 0 <= season < SEASONS_PER_YEAR:
+        raise ValueError(f"Season out of range: {season!r}")
+    if not 1 <= week_in_season <= WEEKS_PER_SEASON:
+        raise ValueError(f"Week in season out of range: {week_in_season!r}")
+    if not 0 <= day < DAYS_PER_WEEK:
+        raise ValueError(f"Day out of range: {day!r}")
+
+    ordinal = layout.start + season * DAYS_PER_SEASON + (week_in_season - 1) * DAYS_PER_WEEK + day
+    if layout.leap_day is not None and ordinal >= layout.leap_day:
+        ordinal += 1 # Step over the Leap Day
+    return ordinal
+
+
+def from_perpetual(year, season=None, week_in_season=None, day=None, extra_day=NO_EXTRA_DAY):
+    """
+    Converts a perpetual date back to a Gregorian date in constant time.
+    Regular days need season (0-3), week_in_season (1-13) and day (0-6);
+    the Year Day and Leap Day only need the year and their extra_day code.
+    """
+    if instrument.enabled:
+        t0 = time.perf_counter_ns()
+        ordinal = ordinal_in(_cached_year_layout(year), season, week_in_season, day, extra_day)
+        instrument.observe("convert.from_perpetual", time.perf_counter_ns() - t0)
+        return datetime.date.fromordinal(ordinal)
+    layout = _cached_year_layout(year)
+    return datetime.date.fromordinal(ordinal_in(layout, season, week_in_season, day, extra_day))
+
+
+def from_perpetual_many(years, seasons, weeks_in_season, days, extra_days=None):
+    """
+    Batch form of `from_perpetual` over parallel sequences.
+    `extra_days` may be omitted when every entry is a regular day.
+    """
+    if extra_days is None:
+        extra_days = [NO_EXTRA_DAY] * len(years)
+    return [
+        from_perpetual(year, season, week_in_season, day, extra_day)
+        for year, season, week_in_season, day, extra_day
+        in zip(years, seasons, weeks_in_season, days, extra_days, strict=True)
+    ]
+
+
+def dated_perpetual(date):
+    """
+    Default range entry: the Gregorian date paired with its PerpetualDate.
+    """
+    return date, to_perpetual(date)
+
+
+def iter_perpetual_dates(start_date, end_date, entry=dated_perpetual):
+    """
+    Yields entry(date) for every date from start_date to end_date (inclusive),
+    one at a time.
+    """
+    for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+        yield entry(datetime.date.fromordinal(ordinal))
+
+
+class PerpetualRange:
+    """
+    Lazy, random-access view of the dates from start_date to end_date (inclusive).
+    Supports len(), indexing, slicing and iteration; each item is entry(date),
+    computed only when it is accessed, so memory does not grow with the range.
+    """
+
+    def __init__(self, start_date, end_date, entry=dated_perpetual):
+        self._ordinals = range(start_date.toordinal(), end_date.toordinal() + 1)
+        self._entry = entry
+
+    @classmethod
+    def _from_ordinals(cls, ordinals, entry):
+        view = cls.__new__(cls)
+        view._ordinals = ordinals
+        view._entry = entry
+        return view
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_ordinals(self._ordinals[index], self._entry)
+        return self._entry(datetime.date.fromordinal(self._ordinals[index]))
+
+    def __iter__(self):
+        entry = self._entry
+        fromordinal = datetime.date.fromordinal
+        for ordinal in self._ordinals:
+            yield entry(fromordinal(ordinal))
+
+    def __repr__(self):
+        if not self._ordinals:
+            return "PerpetualRange(<empty>)"
+        first = datetime.date.fromordinal(self._ordinals[0])
+        last = datetime.date.fromordinal(self._ordinals[-1])
+        step = self._ordinals.step
+        step_str = f", step={step}" if step != 1 else ""
+        return f"PerpetualRange({first}, {last}{step_str})"
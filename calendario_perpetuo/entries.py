@@ -0,0 +1,66 @@
+import functools
+import time
+
+from . import instrument
+from .core import LEAP_DAY, NO_EXTRA_DAY, YEAR_DAY, PerpetualRange, to_perpetual
+from .names import DEFAULT_SCHEME, resolve_names
+
+
+def perpetual_calendar_entry(current_date, names=DEFAULT_SCHEME):
+    """
+    Maps a single standard date to its entry in the perpetual calendar,
+    the dict built by the original scripts.
+    """
+    perpetual_date = to_perpetual(current_date)
+    if instrument.enabled:
+        # Only the formatting is timed here; to_perpetual records its own histogram
+        t0 = time.perf_counter_ns()
+        entry = _format_entry(current_date, perpetual_date, names)
+        instrument.observe("render.entry", time.perf_counter_ns() - t0)
+        return entry
+    return _format_entry(current_date, perpetual_date, names)
+
+
+def _format_entry(current_date, perpetual_date, names):
+    names = resolve_names(names)
+    day_names, season_names = names.day_names, names.season_names
+    extra_day_labels = names.extra_day_labels
+
+    perpetual_day_name = None
+    perpetual_season = None
+    perpetual_week_in_season = None
+    perpetual_extra_day = perpetual_date.extra_day != NO_EXTRA_DAY
+    perpetual_extra_day_type = None
+
+    if perpetual_date.extra_day in (YEAR_DAY, LEAP_DAY):
+        perpetual_extra_day_type = extra_day_labels[perpetual_date.extra_day]
+    else:
+        perpetual_day_name = day_names[perpetual_date.day]
+        perpetual_season = season_names[perpetual_date.season]
+        perpetual_week_in_season = perpetual_date.week_in_season
+
+    return {
+        "current_date": current_date,
+        "std_weekday": current_date.strftime("%A"),
+        "std_date": current_date.strftime("%B %d, %Y"),
+        "perpetual_day_name": perpetual_day_name,
+        "perpetual_season": perpetual_season,
+        "perpetual_week_in_season": perpetual_week_in_season,
+        "perpetual_extra_day": perpetual_extra_day,
+        "perpetual_extra_day_type": perpetual_extra_day_type
+    }
+
+
+def generate_perpetual_calendar_dates(start_date, end_date, names=DEFAULT_SCHEME, lazy=False):
+    """
+    Generates dates for the proposed perpetual calendar and maps them to standard dates.
+    With lazy=True, returns a PerpetualRange whose entries are only built when accessed.
+    """
+    entry = functools.partial(perpetual_calendar_entry, names=resolve_names(names))
+    calendar_range = PerpetualRange(start_date, end_date, entry)
+    if lazy:
+        return calendar_range
+    if instrument.enabled:
+        with instrument.timer("generate.entries", len(calendar_range)):
+            return list(calendar_range)
+    return list(calendar_range)
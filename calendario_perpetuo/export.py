@@ -0,0 +1,324 @@
+import contextlib
+import csv
+import datetime
+import io
+import json
+import sys
+
+from . import instrument
+from .compact import PerpetualColumns
+from .core import NO_EXTRA_DAY
+from .names import DEFAULT_SCHEME, resolve_names
+
+# Days rendered per chunk; each chunk is written with a single write() call.
+DEFAULT_CHUNK_DAYS = 4096
+# Size of the buffer of the output file
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# English names, as printed by strftime("%A") and strftime("%B") in the C locale,
+# looked up by table instead of calling strftime for every day.
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MONTH_NAMES = (
+    None, "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def _iter_days(columns):
+    """
+    Yields (date, year, season, week_in_season, day, extra_day) for every day of a chunk.
+    """
+    fromordinal = datetime.date.fromordinal
+    start_ordinal = columns.start_ordinal
+    for index, fields in enumerate(zip(
+            columns.year, columns.season, columns.week_in_season, columns.day, columns.extra_day)):
+        yield (fromordinal(start_ordinal + index), *fields)
+
+
+# --- CSV ---
+
+def _csv_header(names):
+    return "date,weekday,perpetual_year,season,week_in_season,day,extra_day\r\n"
+
+
+def _csv_rows(columns, names, dtstamp):
+    day_names, season_names = names.day_names, names.season_names
+    extra_day_labels = names.extra_day_labels
+    # Names from registered schemes may hold commas or quotes, so let csv quote them
+    out = io.StringIO()
+    writerow = csv.writer(out).writerow
+    for date, year, season, week, day, extra_day in _iter_days(columns):
+        weekday = WEEKDAY_NAMES[date.weekday()]
+        if extra_day != NO_EXTRA_DAY:
+            writerow((date.isoformat(), weekday, year, "", "", "", extra_day_labels[extra_day]))
+        else:
+            writerow((date.isoformat(), weekday, year, season_names[season], week, day_names[day], ""))
+    return out.getvalue()
+
+
+# --- JSON Lines ---
+
+def _jsonl_rows(columns, names, dtstamp):
+    # Names are JSON-encoded once per chunk, not once per day
+    day_names = [json.dumps(name) for name in names.day_names]
+    season_names = [json.dumps(name) for name in names.season_names]
+    extra_day_labels = {code: json.dumps(label) for code, label in names.extra_day_labels.items()}
+    rows = []
+    for date, year, season, week, day, extra_day in _iter_days(columns):
+        if extra_day != NO_EXTRA_DAY:
+            rows.append(
+                f'{{"date": "{date.isoformat()}", "weekday": "{WEEKDAY_NAMES[date.weekday()]}", '
+                f'"perpetual_year": {year}, "season": null, "week_in_season": null, "day": null, '
+                f'"extra_day": {extra_day_labels[extra_day]}}}\n'
+            )
+        else:
+            rows.append(
+                f'{{"date": "{date.isoformat()}", "weekday": "{WEEKDAY_NAMES[date.weekday()]}", '
+                f'"perpetual_year": {year}, "season": {season_names[season]}, '
+                f'"week_in_season": {week}, "day": {day_names[day]}, "extra_day": null}}\n'
+            )
+    return "".join(rows)
+
+
+# --- Aligned text (as in output.txt) ---
+
+def _text_rows(columns, names, dtstamp):
+    day_names, season_names = names.day_names, names.season_names
+    extra_day_labels = names.extra_day_labels
+    season_width = max(len(name) for name in season_names)
+    rows = []
+    for date, year, season, week, day, extra_day in _iter_days(columns):
+        std_date_str = f"{WEEKDAY_NAMES[date.weekday()]:<9} {MONTH_NAMES[date.month]} {date.day:02d}, {date.year}"
+        if extra_day != NO_EXTRA_DAY:
+            perpetual_date_str = f"--- {extra_day_labels[extra_day]:<30} ---"
+        else:
+            # The first day of the seasons that start after an Equinox
+            start_of_season_marker = ""
+            if week == 1 and day == 0 and date.day == 22 and (
+                    (date.month == 3 and season == 1) or (date.month == 9 and season == 3)):
+                start_of_season_marker = "(Equinox)"
+            perpetual_date_str = (
+                f"{day_names[day]:<9} "
+                f"{season_names[season]:<{season_width}} "
+                f"Week {week:<2} {start_of_season_marker}"
+            )
+        rows.append(f"Standard: {std_date_str:<30} |   Perpetual: {perpetual_date_str}\n")
+    return "".join(rows)
+
+
+# --- iCalendar ---
+
+def export_timestamp():
+    """
+    Returns the current UTC time as an iCalendar DATE-TIME, taken once per export
+    and stamped on every event (DTSTAMP) so that all chunks agree.
+    """
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ics_header(names):
+    return (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        "PRODID:-//calendario_perpetuo//Perpetual Calendar//EN\r\n"
+        "CALSCALE:GREGORIAN\r\n"
+    )
+
+
+def _ics_footer(names):
+    return "END:VCALENDAR\r\n"
+
+
+# Longest content line, in octets, before folding (RFC 5545, section 3.1)
+ICS_LINE_OCTETS = 75
+
+
+def _ics_text(value):
+    """
+    Escapes a TEXT value (RFC 5545, section 3.3.11).
+    """
+    return (
+        value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _ics_line(line):
+    """
+    Returns a content line terminated by CRLF, folded into lines of at most
+    ICS_LINE_OCTETS octets without splitting UTF-8 sequences.
+    """
+    if len(line) * 4 <= ICS_LINE_OCTETS or len(line.encode("utf-8")) <= ICS_LINE_OCTETS:
+        return line + "\r\n"
+    parts = []
+    part, octets = "", 0
+    for char in line:
+        size = len(char.encode("utf-8"))
+        if octets + size > ICS_LINE_OCTETS:
+            parts.append(part)
+            # Continuation lines start with a space, which counts towards the limit
+            part, octets = " ", 1
+        part += char
+        octets += size
+    parts.append(part)
+    return "\r\n".join(parts) + "\r\n"
+
+
+def _ics_rows(columns, names, dtstamp):
+    # Names are escaped once per chunk, not once per day
+    day_names = [_ics_text(name) for name in names.day_names]
+    season_names = [_ics_text(name) for name in names.season_names]
+    extra_day_labels = {code: _ics_text(label) for code, label in names.extra_day_labels.items()}
+    rows = []
+    for date, year, season, week, day, extra_day in _iter_days(columns):
+        if extra_day != NO_EXTRA_DAY:
+            summary = extra_day_labels[extra_day]
+        else:
+            summary = f"{day_names[day]}\\, {season_names[season]} Week {week}"
+        day_str = f"{date.year:04d}{date.month:02d}{date.day:02d}"
+        rows.append(
+            "BEGIN:VEVENT\r\n"
+            f"UID:{day_str}@calendario-perpetuo\r\n"
+            f"DTSTAMP:{dtstamp}\r\n"
+            f"DTSTART;VALUE=DATE:{day_str}\r\n"
+            "DURATION:P1D\r\n"
+            + _ics_line(f"SUMMARY:{summary} ({year})") +
+            "TRANSP:TRANSPARENT\r\n"
+            "END:VEVENT\r\n"
+        )
+    return "".join(rows)
+
+
+def _no_text(names):
+    return ""
+
+
+# format -> (header, rows, footer)
+FORMATS = {
+    "csv": (_csv_header, _csv_rows, _no_text),
+    "jsonl": (_no_text, _jsonl_rows, _no_text),
+    "text": (_no_text, _text_rows, _no_text),
+    "ics": (_ics_header, _ics_rows, _ics_footer),
+}
+
+
+def iter_chunks(start_date, end_date, chunk_days=DEFAULT_CHUNK_DAYS):
+    """
+    Splits the dates from start_date to end_date (inclusive) into PerpetualColumns
+    of at most chunk_days days, built one at a time.
+    """
+    end_ordinal = end_date.toordinal()
+    for chunk_start in range(start_date.toordinal(), end_ordinal + 1, chunk_days):
+        chunk_end = min(chunk_start + chunk_days - 1, end_ordinal)
+        first, last = datetime.date.fromordinal(chunk_start), datetime.date.fromordinal(chunk_end)
+        if instrument.enabled:
+            with instrument.timer("compute.columns", chunk_end - chunk_start + 1):
+                columns = PerpetualColumns(first, last)
+            yield columns
+        else:
+            yield PerpetualColumns(first, last)
+
+
+def _render_rows(format, columns, names, dtstamp):
+    rows = FORMATS[format][1]
+    if instrument.enabled:
+        with instrument.timer(f"render.{format}", len(columns)):
+            return rows(columns, names, dtstamp)
+    return rows(columns, names, dtstamp)
+
+
+def render_chunk(columns, format="csv", names=DEFAULT_SCHEME, dtstamp=None):
+    """
+    Renders the rows of one chunk (without header or footer) in the given format;
+    names is a naming scheme or a CalendarNames. dtstamp is the export_timestamp()
+    of the export the chunk belongs to (default: now).
+    """
+    if dtstamp is None:
+        dtstamp = export_timestamp()
+    return _render_rows(format, columns, resolve_names(names), dtstamp)
+
+
+def iter_export(start_date, end_date, format="csv", names=DEFAULT_SCHEME, chunk_days=DEFAULT_CHUNK_DAYS):
+    """
+    Yields the export of the date range as text blocks: the header, one block
+    per chunk, and the footer. Only one chunk is held in memory at a time.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format: {format!r} (expected one of {', '.join(FORMATS)})")
+    header, rows, footer = FORMATS[format]
+    names = resolve_names(names)
+    dtstamp = export_timestamp()
+    yield header(names)
+    for columns in iter_chunks(start_date, end_date, chunk_days):
+        yield _render_rows(format, columns, names, dtstamp)
+    yield footer(names)
+
+
+def export_schemes(outputs, start_date, end_date, format="csv", chunk_days=DEFAULT_CHUNK_DAYS,
+                   buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Exports the date range once per naming scheme, computing every chunk only once
+    and rendering it under each scheme. outputs maps a scheme name to its output
+    path, or is a sequence of (scheme or CalendarNames, path) pairs (CalendarNames
+    are not hashable). Returns the number of bytes written to each path.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format: {format!r} (expected one of {', '.join(FORMATS)})")
+    header, rows, footer = FORMATS[format]
+    if hasattr(outputs, "items"):
+        outputs = outputs.items()
+    targets = [(resolve_names(names), path) for names, path in outputs]
+    dtstamp = export_timestamp()
+    bytes_written = {path: 0 for _, path in targets}
+    with contextlib.ExitStack() as stack:
+        # Files opened before a failing open() are still closed by the stack
+        files = [stack.enter_context(open(path, "wb", buffering=buffer_size)) for _, path in targets]
+
+        def write(render):
+            for (names, path), out in zip(targets, files):
+                data = render(names).encode("utf-8")
+                out.write(data)
+                bytes_written[path] += len(data)
+
+        write(header)
+        for columns in iter_chunks(start_date, end_date, chunk_days):
+            write(lambda names: _render_rows(format, columns, names, dtstamp))
+        write(footer)
+    if instrument.enabled:
+        instrument.count("export.bytes_written", sum(bytes_written.values()))
+    return bytes_written
+
+
+def write_blocks(blocks, path, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Writes text blocks to path ("-" for stdout) through a large buffer.
+    Returns the number of bytes written.
+    """
+    if path == "-":
+        bytes_written = _write_blocks(blocks, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+        return bytes_written
+    with open(path, "wb", buffering=buffer_size) as out:
+        return _write_blocks(blocks, out)
+
+
+def _write_blocks(blocks, out):
+    bytes_written = 0
+    for block in blocks:
+        data = block.encode("utf-8")
+        out.write(data)
+        bytes_written += len(data)
+    if instrument.enabled:
+        instrument.count("export.bytes_written", bytes_written)
+    return bytes_written
+
+
+def export_range(path, start_date, end_date, format="csv", names=DEFAULT_SCHEME,
+                 chunk_days=DEFAULT_CHUNK_DAYS, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Streams the dates from start_date to end_date (inclusive) to path in one of
+    the FORMATS. Returns the number of bytes written.
+    """
+    blocks = iter_export(start_date, end_date, format, names, chunk_days)
+    return write_blocks(blocks, path, buffer_size)
+
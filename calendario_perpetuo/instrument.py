@@ -0,0 +1,248 @@
+"""
+Optional instrumentation of the conversion, generation, rendering and export
+paths: named counters and timing histograms, off by default.
+
+While disabled, an instrumented function only tests the module-level `enabled`
+flag, once per call (once per range or chunk on the bulk paths). Enable it for
+the whole process with enable(), or for one block with profile():
+
+    with instrument.profile() as stats:
+        export_range("calendar.csv", start_date, end_date)
+    print(json.dumps(stats.snapshot, indent=2))
+
+Worker processes of the parallel export keep their own (disabled) state; only
+the parent's writes are recorded.
+"""
+
+import collections
+import contextlib
+import sys
+import time
+
+enabled = False
+
+# Timings are bucketed by powers of two of nanoseconds: bucket b holds
+# durations d with 2**(b-1) <= d < 2**b.
+HISTOGRAM_BUCKETS = 48
+
+
+class Histogram:
+    """
+    Timing histogram with power-of-two buckets, in nanoseconds.
+    """
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+
+    def observe(self, nanoseconds, count=1):
+        """
+        Records a duration; count > 1 records a batch of that many items timed together.
+        """
+        count = max(count, 1)
+        self.count += count
+        self.total += nanoseconds
+        per_item = nanoseconds // count
+        if self.min is None or per_item < self.min:
+            self.min = per_item
+        if self.max is None or per_item > self.max:
+            self.max = per_item
+        self.buckets[min(per_item.bit_length(), HISTOGRAM_BUCKETS - 1)] += count
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        for bucket, count in enumerate(other.buckets):
+            self.buckets[bucket] += count
+
+    def percentile(self, fraction):
+        """
+        Returns an upper bound, in nanoseconds, of the given percentile (0-1).
+        """
+        rank = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return 1 << bucket
+        return 0
+
+    def summary(self):
+        seconds = self.total / 1e9
+        return {
+            "count": self.count,
+            "total_seconds": seconds,
+            "per_second": self.count / seconds if seconds else None,
+            "mean_ns": self.total / self.count if self.count else None,
+            "min_ns": self.min,
+            "max_ns": self.max,
+            "p50_ns": self.percentile(0.50),
+            "p90_ns": self.percentile(0.90),
+            "p99_ns": self.percentile(0.99),
+            "buckets": {f"<{1 << bucket}ns": count for bucket, count in enumerate(self.buckets) if count},
+        }
+
+
+_counters = collections.Counter()
+_histograms = collections.defaultdict(Histogram)
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    """
+    Clears every counter and histogram.
+    """
+    _counters.clear()
+    _histograms.clear()
+
+
+def count(name, n=1):
+    _counters[name] += n
+
+
+def observe(name, nanoseconds, n=1):
+    _histograms[name].observe(nanoseconds, n)
+
+
+@contextlib.contextmanager
+def timer(name, n=1):
+    """
+    Records the duration of the block in the named histogram, as n items.
+    """
+    t0 = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _histograms[name].observe(time.perf_counter_ns() - t0, n)
+
+
+def _cache_stats(info):
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else None,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+    }
+
+
+def cache_stats():
+    """
+    Returns the hit rates of the package's caches. Modules that were never
+    imported are left out rather than imported here.
+    """
+    from .core import layout_cache_info
+
+    caches = {"year_layout": _cache_stats(layout_cache_info())}
+    for module, attr, name in (
+        ("names", "get_names", "names"),
+        ("search", "cycle_matches", "search_cycles"),
+        ("recurrence", "_year_patterns", "recurrence_patterns"),
+    ):
+        module = sys.modules.get(f"{__package__}.{module}")
+        if module is not None:
+            caches[name] = _cache_stats(getattr(module, attr).cache_info())
+    return caches
+
+
+def _cache_delta(after, before):
+    """
+    Returns the cache stats of after, counting only the lookups made since before.
+    """
+    delta = {}
+    for name, stats in after.items():
+        stats = dict(stats)
+        if name in before:
+            stats["hits"] -= before[name]["hits"]
+            stats["misses"] -= before[name]["misses"]
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else None
+        delta[name] = stats
+    return delta
+
+
+def snapshot():
+    """
+    Returns the counters, histogram summaries and cache hit rates as a
+    JSON-serializable dict.
+    """
+    return {
+        "enabled": enabled,
+        "counters": dict(sorted(_counters.items())),
+        "histograms": {name: _histograms[name].summary() for name in sorted(_histograms)},
+        "caches": cache_stats(),
+    }
+
+
+def dump(path="-"):
+    """
+    Writes the snapshot as JSON to path ("-" for stdout).
+    """
+    import json # Only loaded when a snapshot is written; core imports this module
+
+    text = json.dumps(snapshot(), indent=2)
+    if path == "-":
+        print(text)
+    else:
+        with open(path, "w") as f:
+            f.write(text + "\n")
+
+
+class Profile:
+    """
+    Result of a profile() block: the wall time and the snapshot taken at its end.
+    """
+
+    def __init__(self):
+        self.seconds = None
+        self.snapshot = None
+
+
+@contextlib.contextmanager
+def profile():
+    """
+    Enables instrumentation for the block only, recording into fresh counters and
+    histograms; the Profile it yields holds their snapshot once the block exits,
+    with cache hit rates counting only the block's lookups. Anything recorded is
+    then added to the enclosing state if it was enabled.
+    """
+    global enabled, _counters, _histograms
+    outer = enabled, _counters, _histograms
+    _counters = collections.Counter()
+    _histograms = collections.defaultdict(Histogram)
+    enabled = True
+    result = Profile()
+    caches = cache_stats()
+    t0 = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.seconds = time.perf_counter() - t0
+        result.snapshot = snapshot()
+        result.snapshot["seconds"] = result.seconds
+        result.snapshot["caches"] = _cache_delta(result.snapshot["caches"], caches)
+        inner_counters, inner_histograms = _counters, _histograms
+        enabled, _counters, _histograms = outer
+        if enabled:
+            _counters.update(inner_counters)
+            for name, histogram in inner_histograms.items():
+                _histograms[name].merge(histogram)
@@ -0,0 +1,142 @@
+"""
+Naming schemes: label tables applied to the integer codes of the core engine
+only when a date is rendered. The engine never sees names, so one computed
+range can be rendered under any number of schemes.
+"""
+
+import collections
+import functools
+
+from .core import DAYS_PER_WEEK, LEAP_DAY, SEASONS_PER_YEAR, YEAR_DAY
+
+# Name tables used to render perpetual dates:
+#   day_names         7 day names, indexed by PerpetualDate.day
+#   season_names      4 season names, indexed by PerpetualDate.season
+#   extra_day_labels  labels of the extra days, keyed by YEAR_DAY and LEAP_DAY
+#   header            lines printed above a printed calendar
+CalendarNames = collections.namedtuple(
+    "CalendarNames", ["day_names", "season_names", "extra_day_labels", "header"],
+    defaults=[()],
+)
+
+LATIN_DAY_NAMES = ("Solis", "Lunae", "Stellae", "Terrae", "Aquae", "Aeris", "Ignis")
+
+
+def _latin():
+    # scripts/alpha.py
+    return CalendarNames(
+        LATIN_DAY_NAMES,
+        ("Florea", "Calida", "Fructus", "Frigida"), # Spring, Summer, Autumn, Winter
+        {YEAR_DAY: "Year Day (Winter Solstice)", LEAP_DAY: "Leap Day (Summer Solstice)"},
+        (
+            "--- Perpetual Calendar vs. Standard Calendar ---",
+            "Proposed Days: Solis, Lunae, Stellae, Terrae, Aquae, Aeris, Ignis",
+            "Proposed Seasons: Florea (Spring), Calida (Summer), Fructus (Autumn), Frigida (Winter)",
+            "",
+        ),
+    )
+
+
+def _neutral():
+    # scripts/bravo.py
+    return CalendarNames(
+        LATIN_DAY_NAMES,
+        ("Alpha", "Beta", "Gamma", "Delta"), # Hemisphere-neutral season labels
+        {YEAR_DAY: "Year Day (December Solstice)", LEAP_DAY: "Leap Day (June Solstice)"},
+        (
+            "--- Perpetual Calendar vs. Standard Calendar (Hemisphere-Neutral Seasons) ---",
+            "Proposed Days: Solis, Lunae, Stellae, Terrae, Aquae, Aeris, Ignis",
+            "Proposed Seasons: Alpha, Beta, Gamma, Delta (13 weeks each)",
+            "",
+            "Interpretive Overlay:",
+            "  - Season Alpha: Northern Winter / Southern Summer (Starts after Dec Solstice)",
+            "  - Season Beta:  Northern Spring / Southern Autumn (Starts after March Equinox)",
+            "  - Season Gamma: Northern Summer / Southern Winter (Starts after June Solstice)",
+            "  - Season Delta: Northern Autumn / Southern Spring (Starts after Sept Equinox)",
+            "",
+        ),
+    )
+
+
+def _constellation():
+    # scripts/charlie.py
+    return CalendarNames(
+        LATIN_DAY_NAMES,
+        ("Hunter", "Lion", "Eagle", "Water Bearer"),
+        {YEAR_DAY: "Year Day (December Solstice)", LEAP_DAY: "Leap Day (June Solstice)"},
+        (
+            "--- Perpetual Calendar vs. Standard Calendar (Constellation-Inspired Seasons) ---",
+            "Proposed Days: Solis, Lunae, Stellae, Terrae, Aquae, Aeris, Ignis",
+            "Proposed Seasons: Hunter, Lion, Eagle, Water Bearer (13 weeks each)",
+            "",
+            "Interpretive Overlay for Seasonal Experience:",
+            "  - Hunter: Northern Winter / Southern Summer (Starts after Dec Solstice)",
+            "  - Lion:      Northern Spring / Southern Autumn (Starts after March Equinox)",
+            "  - Eagle:     Northern Summer / Southern Winter (Starts after June Solstice)",
+            "  - Water Bearer:     Northern Autumn / Southern Spring (Starts after Sept Equinox)",
+            "",
+        ),
+    )
+
+
+# Scheme name -> CalendarNames, or a function building it on first use
+_SCHEMES = {
+    "latin": _latin,
+    "neutral": _neutral,
+    "constellation": _constellation,
+}
+
+DEFAULT_SCHEME = "latin"
+
+
+def scheme_names():
+    return list(_SCHEMES)
+
+
+def _check_names(names):
+    if len(names.day_names) != DAYS_PER_WEEK:
+        raise ValueError(f"A naming scheme needs {DAYS_PER_WEEK} day names, got {len(names.day_names)}")
+    if len(names.season_names) != SEASONS_PER_YEAR:
+        raise ValueError(f"A naming scheme needs {SEASONS_PER_YEAR} season names, got {len(names.season_names)}")
+    missing = {YEAR_DAY, LEAP_DAY} - set(names.extra_day_labels)
+    if missing:
+        raise ValueError("A naming scheme needs labels for the Year Day and the Leap Day")
+
+
+def register_scheme(scheme, names, replace=False):
+    """
+    Registers a naming scheme under the given name. names is a CalendarNames,
+    or a function returning one that is only called when the scheme is first used.
+    """
+    if scheme in _SCHEMES and not replace:
+        raise ValueError(f"Naming scheme already registered: {scheme!r}")
+    if isinstance(names, CalendarNames):
+        _check_names(names)
+    _SCHEMES[scheme] = names
+    get_names.cache_clear()
+
+
+@functools.cache
+def get_names(scheme=DEFAULT_SCHEME):
+    """
+    Returns the CalendarNames of a registered naming scheme, loading it on first use.
+    """
+    try:
+        names = _SCHEMES[scheme]
+    except KeyError:
+        raise ValueError(
+            f"Unknown naming scheme: {scheme!r} (expected one of {', '.join(_SCHEMES)})"
+        ) from None
+    if not isinstance(names, CalendarNames):
+        names = names()
+        _check_names(names)
+    return names
+
+
+def resolve_names(names):
+    """
+    Accepts either a scheme name or a CalendarNames and returns the CalendarNames.
+    """
+    if isinstance(names, str):
+        return get_names(names)
+    return names
@@ -0,0 +1,143 @@
+import collections
+import concurrent.futures
+import datetime
+import os
+import sys
+import time
+
+from .core import PerpetualRange, dated_perpetual, to_perpetual, year_start_ordinal
+from .export import (
+    DEFAULT_BUFFER_SIZE, DEFAULT_CHUNK_DAYS, FORMATS, export_timestamp, iter_chunks, render_chunk,
+    write_blocks,
+)
+from .names import DEFAULT_SCHEME, resolve_names
+
+# Perpetual years per task: large enough that process overhead is negligible
+DEFAULT_YEARS_PER_CHUNK = 25
+
+
+def year_aligned_chunks(start_date, end_date, years_per_chunk=DEFAULT_YEARS_PER_CHUNK):
+    """
+    Splits the dates from start_date to end_date (inclusive) into (first, last)
+    date pairs that break only at the start of a perpetual year, so every chunk
+    can be computed independently of the others.
+    """
+    if years_per_chunk < 1:
+        raise ValueError(f"Need at least one year per chunk, got {years_per_chunk!r}")
+    chunks = []
+    end_ordinal = end_date.toordinal()
+    first = start_date.toordinal()
+    year = to_perpetual(start_date).year
+    while first <= end_ordinal:
+        year += years_per_chunk
+        last = min(year_start_ordinal(year) - 1, end_ordinal)
+        chunks.append((datetime.date.fromordinal(first), datetime.date.fromordinal(last)))
+        first = last + 1
+    return chunks
+
+
+def _ordered_map(executor, fn, args, max_pending):
+    """
+    Like executor.map, but keeps at most max_pending tasks in flight, so
+    results that are not consumed yet do not pile up in memory.
+    """
+    pending = collections.deque()
+    for task_args in args:
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, *task_args))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _worker_count(workers):
+    """
+    Returns the number of worker processes to use: workers, or every CPU when None.
+    """
+    if workers is None:
+        return os.cpu_count()
+    if workers < 1:
+        raise ValueError(f"Need at least one worker process, got {workers!r}")
+    return workers
+
+
+def _generate_chunk(first, last, entry):
+    return list(PerpetualRange(first, last, entry))
+
+
+def generate_parallel(start_date, end_date, entry=dated_perpetual, workers=None,
+                      years_per_chunk=DEFAULT_YEARS_PER_CHUNK):
+    """
+    Builds [entry(date) for every date in the range] on a pool of worker processes,
+    in order. entry must be picklable (a module-level function).
+    """
+    workers = _worker_count(workers)
+    chunks = year_aligned_chunks(start_date, end_date, years_per_chunk)
+    result = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = ((first, last, entry) for first, last in chunks)
+        for part in _ordered_map(executor, _generate_chunk, tasks, 2 * workers):
+            result.extend(part)
+    return result
+
+
+def _render_chunk(first, last, format, names, chunk_days, dtstamp):
+    return "".join(
+        render_chunk(columns, format, names, dtstamp) for columns in iter_chunks(first, last, chunk_days)
+    )
+
+
+def iter_export_parallel(start_date, end_date, format="csv", names=DEFAULT_SCHEME, workers=None,
+                         years_per_chunk=DEFAULT_YEARS_PER_CHUNK, chunk_days=DEFAULT_CHUNK_DAYS):
+    """
+    Parallel version of export.iter_export: chunks are rendered on a
+    pool of worker processes and yielded in order, with a bounded number in flight.
+    Invalid arguments raise ValueError here, before any block is requested.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format: {format!r} (expected one of {', '.join(FORMATS)})")
+    workers = _worker_count(workers)
+    chunks = year_aligned_chunks(start_date, end_date, years_per_chunk)
+    return _iter_blocks(chunks, format, resolve_names(names), workers, chunk_days, export_timestamp())
+
+
+def _iter_blocks(chunks, format, names, workers, chunk_days, dtstamp):
+    header, rows, footer = FORMATS[format]
+    yield header(names)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = ((first, last, format, names, chunk_days, dtstamp) for first, last in chunks)
+        yield from _ordered_map(executor, _render_chunk, tasks, 2 * workers)
+    yield footer(names)
+
+
+def export_range_parallel(path, start_date, end_date, format="csv", names=DEFAULT_SCHEME, workers=None,
+                          years_per_chunk=DEFAULT_YEARS_PER_CHUNK, chunk_days=DEFAULT_CHUNK_DAYS,
+                          buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Streams the date range to path like export.export_range, rendering
+    on worker processes. Returns the number of bytes written.
+    """
+    blocks = iter_export_parallel(start_date, end_date, format, names, workers, years_per_chunk, chunk_days)
+    return write_blocks(blocks, path, buffer_size)
+
+
+if __name__ == "__main__":
+    # Benchmark: wall-clock speedup of a 2,000-year CSV export vs. worker count.
+    # Usage: python -m calendario_perpetuo.parallel [max_workers]
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    start_date = datetime.date(2000, 12, 22)
+    end_date = datetime.date(4000, 12, 21)
+    days = end_date.toordinal() - start_date.toordinal() + 1
+
+    t0 = time.perf_counter()
+    write_blocks((render_chunk(columns, "csv") for columns in iter_chunks(start_date, end_date)), os.devnull)
+    serial = time.perf_counter() - t0
+    print(f"serial     {serial:7.3f} s  {days / serial:12,.0f} days/sec")
+
+    workers = 1
+    while workers <= max_workers:
+        t0 = time.perf_counter()
+        export_range_parallel(os.devnull, start_date, end_date, "csv", workers=workers)
+        elapsed = time.perf_counter() - t0
+        print(f"workers={workers:<3} {elapsed:7.3f} s  {days / elapsed:12,.0f} days/sec  speedup {serial / elapsed:5.2f}x")
+        workers *= 2
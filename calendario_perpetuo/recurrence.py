@@ -0,0 +1,183 @@
+"""
+Recurring events. A (season, week, day) sits at the same offset from the start
+of every perpetual year, shifted by one after the Leap Day in leap years, so a
+rule is reduced once to its offsets in a common and in a leap year, and
+expanding it over a window only adds those offsets to each year's first day.
+"""
+
+import bisect
+import collections
+import datetime
+import functools
+
+from .core import (
+    DAYS_PER_SEASON, DAYS_PER_WEEK, LEAP_DAY, LEAP_DAY_OFFSET, REGULAR_DAYS_PER_YEAR,
+    SEASONS_PER_YEAR, WEEKS_PER_SEASON, YEAR_DAY, perpetual_year_of, year_layout,
+)
+
+# A recurrence rule. Each field is a value, a collection of values, or None for all of them:
+#   days             perpetual days, 0-6 (Solis .. Ignis)
+#   weeks_in_season  weeks, 1-13
+#   seasons          seasons, 0-3
+#   extra_days       YEAR_DAY and/or LEAP_DAY (default: none)
+# The rule matches the regular days in all three of days, weeks_in_season and seasons,
+# plus its extra days. A rule with only extra_days set matches only those, e.g.
+#   Recurrence(days=4, weeks_in_season=3)   every Aquae of week 3, in every season
+#   Recurrence(extra_days=YEAR_DAY)         every Year Day
+Recurrence = collections.namedtuple(
+    "Recurrence", ["days", "weeks_in_season", "seasons", "extra_days"],
+    defaults=[None, None, None, ()],
+)
+
+_FIELD_RANGES = {
+    "days": range(DAYS_PER_WEEK),
+    "weeks_in_season": range(1, WEEKS_PER_SEASON + 1),
+    "seasons": range(SEASONS_PER_YEAR),
+    "extra_days": (YEAR_DAY, LEAP_DAY),
+}
+
+
+def _values(field, value):
+    valid = _FIELD_RANGES[field]
+    if value is None:
+        return tuple(valid)
+    if isinstance(value, int):
+        value = (value,)
+    values = tuple(sorted(set(value)))
+    for v in values:
+        if v not in valid:
+            raise ValueError(f"{field} out of range: {v!r}")
+    return values
+
+
+def normalize_rule(rule):
+    """
+    Returns the rule with every field as a sorted tuple of values, raising
+    ValueError on values out of range.
+    """
+    extra_days = () if rule.extra_days is None else _values("extra_days", rule.extra_days)
+    if (rule.days, rule.weeks_in_season, rule.seasons) == (None, None, None) and extra_days:
+        return Recurrence((), (), (), extra_days)
+    return Recurrence(
+        _values("days", rule.days),
+        _values("weeks_in_season", rule.weeks_in_season),
+        _values("seasons", rule.seasons),
+        extra_days,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _year_patterns(rule):
+    """
+    Returns the sorted offsets, from the first day of the year, of the days
+    matched by a normalized rule, in a common and in a leap year.
+    """
+    offsets = sorted(
+        season * DAYS_PER_SEASON + (week_in_season - 1) * DAYS_PER_WEEK + day
+        for season in rule.seasons
+        for week_in_season in rule.weeks_in_season
+        for day in rule.days
+    )
+    split = bisect.bisect_left(offsets, LEAP_DAY_OFFSET)
+    before, after = offsets[:split], offsets[split:]
+    year_day = [REGULAR_DAYS_PER_YEAR] if YEAR_DAY in rule.extra_days else []
+    leap_day = [LEAP_DAY_OFFSET] if LEAP_DAY in rule.extra_days else []
+
+    common = tuple(before + after + year_day)
+    # After the Leap Day, days (and the Year Day) move forward by one
+    leap = tuple(before + leap_day + [offset + 1 for offset in after + year_day])
+    return common, leap
+
+
+def rule_offsets(rule):
+    """
+    Returns the offsets of the rule's days from the first day of a common year
+    and of a leap year, as two sorted tuples.
+    """
+    return _year_patterns(normalize_rule(rule))
+
+
+def _window_years(first, last):
+    """
+    Returns (start ordinal, is leap) for each perpetual year overlapping the
+    ordinal window, computed once and shared by every rule expanded over it.
+    """
+    first_year = perpetual_year_of(datetime.date.fromordinal(first))
+    last_year = perpetual_year_of(datetime.date.fromordinal(last))
+    years = []
+    for year in range(first_year, last_year + 1):
+        layout = year_layout(year)
+        years.append((layout.start, layout.leap_day is not None))
+    return years
+
+
+def _expand_ordinals(patterns, years, first, last):
+    common, leap = patterns
+    ordinals = []
+    for start, is_leap in years:
+        ordinals.extend([start + offset for offset in (leap if is_leap else common)])
+    # Only the first and last years can overhang the window
+    lo = bisect.bisect_left(ordinals, first)
+    hi = bisect.bisect_right(ordinals, last)
+    return ordinals[lo:hi]
+
+
+def _expand_shared(rules, start_date, end_date):
+    """
+    Returns the sorted ordinal list of each rule, with rules that reduce to the
+    same offsets sharing one list.
+    """
+    first, last = start_date.toordinal(), end_date.toordinal()
+    if first > last:
+        return [[] for _ in rules]
+    years = _window_years(first, last)
+    expanded = {}
+    results = []
+    for rule in rules:
+        patterns = rule_offsets(rule)
+        ordinals = expanded.get(patterns)
+        if ordinals is None:
+            ordinals = expanded[patterns] = _expand_ordinals(patterns, years, first, last)
+        results.append(ordinals)
+    return results
+
+
+def expand_ordinals_many(rules, start_date, end_date):
+    """
+    Batch form of `expand` returning date ordinals: one sorted list per rule,
+    from start_date to end_date (inclusive). Year layouts are computed once for
+    the window and identical rules are only expanded once.
+    """
+    results = []
+    seen = set()
+    for ordinals in _expand_shared(rules, start_date, end_date):
+        # Every rule gets a list of its own, so callers can modify their results
+        results.append(ordinals.copy() if id(ordinals) in seen else ordinals)
+        seen.add(id(ordinals))
+    return results
+
+
+def expand_many(rules, start_date, end_date):
+    """
+    Expands many recurrence rules over the same window at once, returning one
+    sorted list of Gregorian dates per rule.
+    """
+    fromordinal = datetime.date.fromordinal
+    dates = {}
+    results = []
+    for ordinals in _expand_shared(rules, start_date, end_date):
+        # Rules sharing their days share the expanded ordinals, so convert them once
+        key = id(ordinals)
+        if key in dates:
+            results.append(dates[key].copy())
+        else:
+            dates[key] = [fromordinal(ordinal) for ordinal in ordinals]
+            results.append(dates[key])
+    return results
+
+
+def expand(rule, start_date, end_date):
+    """
+    Returns the Gregorian dates from start_date to end_date (inclusive) matched by the rule.
+    """
+    return expand_many([rule], start_date, end_date)[0]
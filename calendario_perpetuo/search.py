@@ -0,0 +1,171 @@
+"""
+Coincidence search: the dates where perpetual and Gregorian fields line up,
+such as every Ignis that falls on a Friday, or every Leap Day on a Sunday.
+
+Both calendars repeat every 400 years (146,097 days, a whole number of weeks),
+so the matches of a query are located once within one cycle, from candidates
+that already satisfy its most selective field, and then shifted by whole
+cycles. Searching a range costs one step per match, however long the range.
+"""
+
+import array
+import bisect
+import collections
+import datetime
+import functools
+
+from .core import (
+    DAYS_PER_WEEK, LEAP_DAY, NO_EXTRA_DAY, SEASONS_PER_YEAR, WEEKS_PER_SEASON, YEAR_DAY,
+    ordinal_in, to_perpetual, year_layout,
+)
+from .table import CYCLE_BASE_ORDINAL, CYCLE_BASE_YEAR, CYCLE_DAYS, CYCLE_YEARS
+
+# Fields a date must match; None matches anything:
+#   day             perpetual day, 0-6 (Solis .. Ignis)
+#   season          perpetual season, 0-3
+#   week_in_season  perpetual week, 1-13
+#   extra_day       NO_EXTRA_DAY (regular days only), YEAR_DAY or LEAP_DAY
+#   weekday         Gregorian weekday, 0-6 (Monday .. Sunday, as in date.weekday())
+#   month           Gregorian month, 1-12
+#   month_day       Gregorian day of the month, 1-31
+Coincidence = collections.namedtuple(
+    "Coincidence",
+    ["day", "season", "week_in_season", "extra_day", "weekday", "month", "month_day"],
+    defaults=[None] * 7,
+)
+
+# Field -> valid values
+_FIELD_RANGES = {
+    "day": range(DAYS_PER_WEEK),
+    "season": range(SEASONS_PER_YEAR),
+    "week_in_season": range(1, WEEKS_PER_SEASON + 1),
+    "extra_day": (NO_EXTRA_DAY, YEAR_DAY, LEAP_DAY),
+    "weekday": range(7),
+    "month": range(1, 13),
+    "month_day": range(1, 32),
+}
+
+
+def _check_query(query):
+    for field, value in zip(query._fields, query):
+        if value is not None and value not in _FIELD_RANGES[field]:
+            raise ValueError(f"{field} out of range: {value!r}")
+
+
+def _perpetual_candidates(layout, query):
+    """
+    Yields the regular days of the year matching the query's perpetual fields.
+    """
+    seasons = range(SEASONS_PER_YEAR) if query.season is None else (query.season,)
+    weeks = range(1, WEEKS_PER_SEASON + 1) if query.week_in_season is None else (query.week_in_season,)
+    days = range(DAYS_PER_WEEK) if query.day is None else (query.day,)
+    for season in seasons:
+        for week_in_season in weeks:
+            for day in days:
+                yield ordinal_in(layout, season, week_in_season, day)
+
+
+def _gregorian_candidates(layout, query):
+    """
+    Yields the days of the year matching the query's Gregorian month and day of the month.
+    """
+    # A perpetual year covers the end of December of the previous Gregorian year
+    months = [(layout.year - 1, 12)] + [(layout.year, month) for month in range(1, 13)]
+    for year, month in months:
+        if query.month is not None and month != query.month:
+            continue
+        first = datetime.date(year, month, 1).toordinal()
+        if month == 12:
+            end = datetime.date(year + 1, 1, 1).toordinal()
+        else:
+            end = datetime.date(year, month + 1, 1).toordinal()
+        if query.month_day is not None:
+            first += query.month_day - 1
+            end = min(end, first + 1)
+        yield from range(max(first, layout.start), min(end, layout.year_day + 1))
+
+
+def _candidates(layout, query):
+    """
+    Yields, in order, a superset of the year's matches, generated from the query's
+    most selective fields so that few candidates are rejected.
+    """
+    if query.extra_day == YEAR_DAY:
+        return (layout.year_day,)
+    if query.extra_day == LEAP_DAY:
+        return () if layout.leap_day is None else (layout.leap_day,)
+    if query.month_day is not None:
+        return _gregorian_candidates(layout, query)
+    if query.extra_day == NO_EXTRA_DAY or (query.day, query.season, query.week_in_season) != (None, None, None):
+        return _perpetual_candidates(layout, query)
+    if query.month is not None:
+        return _gregorian_candidates(layout, query)
+    return range(layout.start, layout.year_day + 1)
+
+
+def _matches(date, perpetual_date, query):
+    if query.weekday is not None and date.weekday() != query.weekday:
+        return False
+    if query.month is not None and date.month != query.month:
+        return False
+    if query.month_day is not None and date.day != query.month_day:
+        return False
+    extra_day = perpetual_date.extra_day
+    if query.extra_day is not None and extra_day != query.extra_day:
+        return False
+    if (query.day, query.season, query.week_in_season) != (None, None, None):
+        return (
+            extra_day == NO_EXTRA_DAY
+            and query.day in (None, perpetual_date.day)
+            and query.season in (None, perpetual_date.season)
+            and query.week_in_season in (None, perpetual_date.week_in_season)
+        )
+    return True
+
+
+@functools.lru_cache(maxsize=32)
+def cycle_matches(query):
+    """
+    Returns the sorted offsets, from the first day of the 400-year cycle, of the
+    days matching the query (a Coincidence).
+    """
+    _check_query(query)
+    offsets = array.array("l")
+    for year in range(CYCLE_BASE_YEAR, CYCLE_BASE_YEAR + CYCLE_YEARS):
+        for ordinal in _candidates(year_layout(year), query):
+            date = datetime.date.fromordinal(ordinal)
+            if _matches(date, to_perpetual(date), query):
+                offsets.append(ordinal - CYCLE_BASE_ORDINAL)
+    return offsets
+
+
+def find_coincidences(start_date, end_date, day=None, season=None, week_in_season=None,
+                      extra_day=None, weekday=None, month=None, month_day=None):
+    """
+    Lazily yields (date, PerpetualDate) for every date from start_date to end_date
+    (inclusive) matching all of the given fields (see Coincidence), e.g.
+
+        find_coincidences(start, end, day=6, weekday=4)           # Ignis on a Friday
+        find_coincidences(start, end, extra_day=LEAP_DAY, weekday=6) # Leap Day on a Sunday
+    """
+    query = Coincidence(day, season, week_in_season, extra_day, weekday, month, month_day)
+    offsets = cycle_matches(query) # Validates the query before the first date is requested
+    return _iter_matches(offsets, start_date.toordinal(), end_date.toordinal())
+
+
+def _iter_matches(offsets, first, last):
+    if not offsets:
+        return
+    cycle, offset = divmod(first - CYCLE_BASE_ORDINAL, CYCLE_DAYS)
+    base = CYCLE_BASE_ORDINAL + cycle * CYCLE_DAYS
+    index = bisect.bisect_left(offsets, offset)
+    fromordinal = datetime.date.fromordinal
+    while True:
+        for index in range(index, len(offsets)):
+            ordinal = base + offsets[index]
+            if ordinal > last:
+                return
+            date = fromordinal(ordinal)
+            yield date, to_perpetual(date)
+        index = 0
+        base += CYCLE_DAYS
@@ -0,0 +1,249 @@
+"""
+Astronomical mode: the Year Day falls on the date of the December solstice and,
+in years of 366 days, the Leap Day on the date of the June solstice, both in a
+configurable time zone, instead of on the fixed Dec 21 and June 21.
+
+Solstice instants come from Meeus' algorithm (Astronomical Algorithms, ch. 27,
+accurate to about a minute) with the Espenak-Meeus polynomials for Delta T.
+They are computed once, on first use, into a table of UT minutes for 1600-2600;
+each time zone then gets a table of year layouts, so conversions are still a
+single lookup followed by the same arithmetic as the fixed mode.
+"""
+
+import array
+import datetime
+import functools
+import math
+
+from .core import (
+    NO_EXTRA_DAY, REGULAR_DAYS_PER_YEAR, layout_from_anchors, ordinal_in, perpetual_date_in,
+)
+
+FIRST_YEAR = 1600
+LAST_YEAR = 2600
+
+JUNE = 6
+DECEMBER = 12
+
+# Julian day of 0001-01-01 00:00 UT, the start of date ordinal 1
+ORDINAL_EPOCH_JD = 1721425.5
+MINUTES_PER_DAY = 24 * 60
+
+# Mean solstice, as JDE polynomials in millennia from 2000 (Meeus, table 27.B)
+_MEAN_SOLSTICE = {
+    JUNE: (2451716.56767, 365241.62603, 0.00325, 0.00888, -0.00030),
+    DECEMBER: (2451900.05952, 365242.74049, -0.06223, -0.00823, 0.00032),
+}
+
+# Periodic terms A, B (degrees), C (degrees per century) (Meeus, table 27.C)
+_PERIODIC_TERMS = (
+    (485, 324.96, 1934.136), (203, 337.23, 32964.467), (199, 342.08, 20.186),
+    (182, 27.85, 445267.112), (156, 73.14, 45036.886), (136, 171.52, 22518.443),
+    (77, 222.54, 65928.934), (74, 296.72, 3034.906), (70, 243.58, 9037.513),
+    (58, 119.81, 33718.147), (52, 297.17, 150.678), (50, 21.02, 2281.226),
+    (45, 247.54, 29929.562), (44, 325.15, 31555.956), (29, 60.93, 4443.417),
+    (18, 155.12, 67555.328), (17, 288.79, 4562.452), (16, 198.04, 62894.029),
+    (14, 199.76, 31436.921), (12, 95.39, 14577.848), (12, 287.11, 31931.756),
+    (12, 320.81, 34777.259), (9, 227.73, 1222.114), (8, 15.45, 16859.074),
+)
+
+
+def solstice_jde(year, month):
+    """
+    Returns the instant of the June (month=6) or December (month=12) solstice
+    of the given year, as a Julian Ephemeris Day (Terrestrial Time).
+    """
+    y = (year - 2000) / 1000
+    a0, a1, a2, a3, a4 = _MEAN_SOLSTICE[month]
+    jde0 = a0 + y * (a1 + y * (a2 + y * (a3 + y * a4)))
+    t = (jde0 - 2451545.0) / 36525
+    w = math.radians(35999.373 * t - 2.47)
+    delta_lambda = 1 + 0.0334 * math.cos(w) + 0.0007 * math.cos(2 * w)
+    s = sum(a * math.cos(math.radians(b + c * t)) for a, b, c in _PERIODIC_TERMS)
+    return jde0 + 0.00001 * s / delta_lambda
+
+
+def delta_t(year):
+    """
+    Returns TT - UT in seconds around the middle of the given year
+    (Espenak and Meeus polynomial expressions).
+    """
+    y = year + 0.5
+    if y < 1700:
+        t = y - 1600
+        return 120 - 0.9808 * t - 0.01532 * t ** 2 + t ** 3 / 7129
+    if y < 1800:
+        t = y - 1700
+        return 8.83 + 0.1603 * t - 0.0059285 * t ** 2 + 0.00013336 * t ** 3 - t ** 4 / 1174000
+    if y < 1860:
+        t = y - 1800
+        return (
+            13.72 - 0.332447 * t + 0.0068612 * t ** 2 + 0.0041116 * t ** 3 - 0.00037436 * t ** 4
+            + 0.0000121272 * t ** 5 - 0.0000001699 * t ** 6 + 0.000000000875 * t ** 7
+        )
+    if y < 1900:
+        t = y - 1860
+        return (
+            7.62 + 0.5737 * t - 0.251754 * t ** 2 + 0.01680668 * t ** 3
+            - 0.0004473624 * t ** 4 + t ** 5 / 233174
+        )
+    if y < 1920:
+        t = y - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t ** 2 + 0.0061966 * t ** 3 - 0.000197 * t ** 4
+    if y < 1941:
+        t = y - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t ** 2 + 0.0020936 * t ** 3
+    if y < 1961:
+        t = y - 1950
+        return 29.07 + 0.407 * t - t ** 2 / 233 + t ** 3 / 2547
+    if y < 1986:
+        t = y - 1975
+        return 45.45 + 1.067 * t - t ** 2 / 260 - t ** 3 / 718
+    if y < 2005:
+        t = y - 2000
+        return (
+            63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3
+            + 0.000651814 * t ** 4 + 0.00002373599 * t ** 5
+        )
+    if y < 2050:
+        t = y - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t ** 2
+    u = (y - 1820) / 100
+    if y < 2150:
+        return -20 + 32 * u ** 2 - 0.5628 * (2150 - y)
+    return -20 + 32 * u ** 2
+
+
+@functools.cache
+def solstice_table():
+    """
+    Returns the UT instants of the solstices as two arrays of minutes since
+    0001-01-01 00:00 UT: (June solstices of FIRST_YEAR..LAST_YEAR, December
+    solstices of FIRST_YEAR - 1..LAST_YEAR), computed on first use.
+    """
+    def minutes(year, month):
+        jd_ut = solstice_jde(year, month) - delta_t(year) / 86400
+        return round((jd_ut - ORDINAL_EPOCH_JD) * MINUTES_PER_DAY)
+
+    june = array.array("l", (minutes(year, JUNE) for year in range(FIRST_YEAR, LAST_YEAR + 1)))
+    december = array.array("l", (minutes(year, DECEMBER) for year in range(FIRST_YEAR - 1, LAST_YEAR + 1)))
+    return june, december
+
+
+_UT_EPOCH = datetime.datetime(1, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def solstice(year, month, tz=datetime.timezone.utc):
+    """
+    Returns the June (month=6) or December (month=12) solstice of the given year
+    as an aware datetime in the time zone tz, to the minute.
+    """
+    june, december = solstice_table()
+    if month == JUNE and FIRST_YEAR <= year <= LAST_YEAR:
+        minutes = june[year - FIRST_YEAR]
+    elif month == DECEMBER and FIRST_YEAR - 1 <= year <= LAST_YEAR:
+        minutes = december[year - FIRST_YEAR + 1]
+    elif month in (JUNE, DECEMBER):
+        raise ValueError(f"Solstices are only tabulated for {FIRST_YEAR}-{LAST_YEAR}, not {year}")
+    else:
+        raise ValueError(f"Solstices fall in June (6) or December (12), not month {month!r}")
+    return (_UT_EPOCH + datetime.timedelta(minutes=minutes)).astimezone(tz)
+
+
+def _time_zone(tz):
+    if isinstance(tz, str):
+        import zoneinfo
+        try:
+            return zoneinfo.ZoneInfo(tz)
+        except zoneinfo.ZoneInfoNotFoundError:
+            raise ValueError(f"Unknown time zone: {tz!r}") from None
+    return tz
+
+
+class SolsticeCalendar:
+    """
+    Conversions with the Year Day on the local date of the December solstice and,
+    in years of 366 days, the Leap Day on the local date of the June solstice.
+    Perpetual year Y runs from the day after the December solstice of Y-1 to the
+    December solstice of Y, for FIRST_YEAR <= Y <= LAST_YEAR.
+
+    tz is a tzinfo or an IANA time zone name. Use `solstice_calendar` to share
+    one instance (and its layout table) per time zone.
+    """
+
+    def __init__(self, tz=datetime.timezone.utc):
+        self.tz = _time_zone(tz)
+        # Year Day ordinal of each Gregorian year from FIRST_YEAR - 1, to find the perpetual year of a date
+        self._year_days = [self._local_ordinal(minutes) for minutes in solstice_table()[1]]
+        # Layouts are built on first use, so that a year made irregular by a jump in
+        # the zone's UTC offset only fails when it is converted
+        self._layouts = [None] * (LAST_YEAR - FIRST_YEAR + 1)
+
+    def _local_ordinal(self, minutes):
+        return (_UT_EPOCH + datetime.timedelta(minutes=minutes)).astimezone(self.tz).toordinal()
+
+    def _build_layout(self, year):
+        index = year - FIRST_YEAR
+        start, year_day = self._year_days[index] + 1, self._year_days[index + 1]
+        length = year_day - start + 1
+        if length == REGULAR_DAYS_PER_YEAR + 1:
+            leap_day = None
+        elif length == REGULAR_DAYS_PER_YEAR + 2:
+            leap_day = self._local_ordinal(solstice_table()[0][index])
+        else:
+            raise ValueError(
+                f"Perpetual year {year} would have {length} days in time zone {self.tz} "
+                f"(its UTC offset jumps between the December solstices)"
+            )
+        return layout_from_anchors(year, start, leap_day, year_day)
+
+    def year_layout(self, year):
+        """
+        Returns the YearLayout of the given perpetual year, raising ValueError for
+        years outside FIRST_YEAR..LAST_YEAR and for years that a change of the
+        zone's UTC offset leaves with fewer than 365 or more than 366 days.
+        """
+        if not FIRST_YEAR <= year <= LAST_YEAR:
+            raise ValueError(f"The solstice calendar covers perpetual years {FIRST_YEAR}-{LAST_YEAR}, not {year}")
+        layout = self._layouts[year - FIRST_YEAR]
+        if layout is None:
+            layout = self._layouts[year - FIRST_YEAR] = self._build_layout(year)
+        return layout
+
+    def perpetual_year_of(self, date):
+        """
+        Returns the perpetual year that contains the given Gregorian date.
+        """
+        year = date.year
+        if FIRST_YEAR - 1 <= year <= LAST_YEAR and date.toordinal() > self._year_days[year - FIRST_YEAR + 1]:
+            return year + 1
+        return year
+
+    def to_perpetual(self, date):
+        """
+        Converts a Gregorian date to a PerpetualDate in constant time.
+        """
+        return perpetual_date_in(self.year_layout(self.perpetual_year_of(date)), date.toordinal())
+
+    def from_perpetual(self, year, season=None, week_in_season=None, day=None, extra_day=NO_EXTRA_DAY):
+        """
+        Converts a perpetual date back to a Gregorian date in constant time;
+        see core.from_perpetual.
+        """
+        return datetime.date.fromordinal(
+            ordinal_in(self.year_layout(year), season, week_in_season, day, extra_day)
+        )
+
+    def __repr__(self):
+        return f"SolsticeCalendar({self.tz!s})"
+
+
+@functools.lru_cache(maxsize=16)
+def solstice_calendar(tz="UTC"):
+    """
+    Returns the SolsticeCalendar of a time zone (a tzinfo or an IANA name),
+    shared by every caller.
+    """
+    if tz == "UTC":
+        tz = datetime.timezone.utc
+    return SolsticeCalendar(tz)
@@ -0,0 +1,136 @@
+import array
+import datetime
+import mmap
+import os
+import struct
+import sys
+
+from .core import (
+    DAYS_PER_WEEK, LEAP_DAY, NO_EXTRA_DAY, REGULAR_DAYS_PER_YEAR, WEEKS_PER_SEASON,
+    YEAR_DAY, PerpetualDate, to_perpetual, year_start_ordinal,
+)
+
+# Both the anchor (Dec 22) and the Leap Day rule follow the Gregorian calendar,
+# so the perpetual mapping repeats every 400 Gregorian years (146,097 days).
+CYCLE_YEARS = 400
+CYCLE_DAYS = 146097
+CYCLE_BASE_YEAR = 2 # The table starts on Dec 22 of year 1, the first day of perpetual year 2
+CYCLE_BASE_ORDINAL = year_start_ordinal(CYCLE_BASE_YEAR)
+
+# File layout: an 8-byte magic header, then one little-endian record per day of
+# the cycle: uint16 year within the cycle, uint16 day code (see _code_fields).
+TABLE_MAGIC = b"PCYCLE1\0"
+RECORD = struct.Struct("<HH")
+
+YEAR_DAY_CODE = REGULAR_DAYS_PER_YEAR # 364
+LEAP_DAY_CODE = REGULAR_DAYS_PER_YEAR + 1 # 365
+
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perpetual_cycle.bin")
+
+
+def _code_fields(code):
+    if code == YEAR_DAY_CODE:
+        return None, None, None, YEAR_DAY
+    if code == LEAP_DAY_CODE:
+        return None, None, None, LEAP_DAY
+    week, day = divmod(code, DAYS_PER_WEEK)
+    season, week_in_season = divmod(week, WEEKS_PER_SEASON)
+    return season, week_in_season + 1, day, NO_EXTRA_DAY
+
+
+def _day_code(perpetual_date):
+    if perpetual_date.extra_day == YEAR_DAY:
+        return YEAR_DAY_CODE
+    if perpetual_date.extra_day == LEAP_DAY:
+        return LEAP_DAY_CODE
+    return (
+        (perpetual_date.season * WEEKS_PER_SEASON + perpetual_date.week_in_season - 1)
+        * DAYS_PER_WEEK + perpetual_date.day
+    )
+
+
+def build_table(path=DEFAULT_TABLE_PATH):
+    """
+    Computes one 400-year cycle of the perpetual mapping and writes it to path.
+    """
+    records = array.array("H")
+    for ordinal in range(CYCLE_BASE_ORDINAL, CYCLE_BASE_ORDINAL + CYCLE_DAYS):
+        perpetual_date = to_perpetual(datetime.date.fromordinal(ordinal))
+        records.append(perpetual_date.year - CYCLE_BASE_YEAR)
+        records.append(_day_code(perpetual_date))
+    if sys.byteorder != "little":
+        records.byteswap()
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(TABLE_MAGIC)
+        records.tofile(f)
+    os.replace(tmp_path, path) # Readers never see a half-written table
+
+
+class CycleTable:
+    """
+    Read-only, memory-mapped view of a table written by build_table.
+    The mapping is shared between every process that opens the same file.
+    """
+
+    def __init__(self, path=DEFAULT_TABLE_PATH):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if (self._mmap[:len(TABLE_MAGIC)] != TABLE_MAGIC or
+                len(self._mmap) != len(TABLE_MAGIC) + CYCLE_DAYS * RECORD.size):
+            self._mmap.close()
+            raise ValueError(f"Not a perpetual cycle table: {path}")
+        # (season, week_in_season, day, extra_day) for every day code
+        self._code_fields = [_code_fields(code) for code in range(LEAP_DAY_CODE + 1)]
+
+    def to_perpetual(self, date):
+        """
+        Same result as core.to_perpetual, with a single table lookup.
+        """
+        cycle, index = divmod(date.toordinal() - CYCLE_BASE_ORDINAL, CYCLE_DAYS)
+        year_in_cycle, code = RECORD.unpack_from(self._mmap, len(TABLE_MAGIC) + index * RECORD.size)
+        return PerpetualDate(CYCLE_BASE_YEAR + cycle * CYCLE_YEARS + year_in_cycle, *self._code_fields[code])
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_table(path=DEFAULT_TABLE_PATH):
+    """
+    Returns a CycleTable for path, or None if no table has been built there.
+    """
+    if not os.path.exists(path):
+        return None
+    return CycleTable(path)
+
+
+_default_table = None
+_default_table_loaded = False
+
+
+def lookup_perpetual(date):
+    """
+    Converts a date through the default table, computing the result with
+    core.to_perpetual when no table file exists.
+    """
+    global _default_table, _default_table_loaded
+    if not _default_table_loaded:
+        _default_table = open_table()
+        _default_table_loaded = True
+    if _default_table is None:
+        return to_perpetual(date)
+    return _default_table.to_perpetual(date)
+
+
+if __name__ == "__main__":
+    # Build step: python -m calendario_perpetuo.table [path]
+    table_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TABLE_PATH
+    build_table(table_path)
+    print(f"Wrote {CYCLE_DAYS:,} days ({os.path.getsize(table_path):,} bytes) to {table_path}")
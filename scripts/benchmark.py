@@ -0,0 +1,216 @@
+import argparse
+import datetime
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from calendario_perpetuo import PerpetualRange
+from calendario_perpetuo.compact import PerpetualColumns
+
+START_DATE = datetime.date.min
+
+# Range sizes, in days: 1 day, then 1 to 10,000 years.
+# datetime stops at 9999-12-31, so the largest range is every representable date.
+SIZES = {
+    "1d": 1,
+    "1y": 365,
+    "10y": 3652,
+    "100y": 36524,
+    "1000y": 365242,
+    "9999y": datetime.date.max.toordinal(),
+}
+
+
+def _script_generator(name):
+    def load():
+        return importlib.import_module(name).generate_perpetual_calendar_dates
+    return load
+
+
+def _range_generator():
+    return lambda start_date, end_date: list(PerpetualRange(start_date, end_date))
+
+
+def _columns_generator():
+    return PerpetualColumns
+
+
+def _numpy_generator():
+    import numpy as np
+    from calendario_perpetuo.vectorized import to_perpetual_array
+
+    def generate(start_date, end_date):
+        return to_perpetual_array(np.arange(start_date.toordinal(), end_date.toordinal() + 1))
+    return generate
+
+
+# Implementation name -> loader returning generate(start_date, end_date)
+IMPLEMENTATIONS = {
+    "alpha": _script_generator("alpha"),
+    "bravo": _script_generator("bravo"),
+    "charlie": _script_generator("charlie"),
+    "range": _range_generator,
+    "columns": _columns_generator,
+    "numpy": _numpy_generator,
+}
+
+
+def _time(generate, start_date, end_date, min_time):
+    """
+    Best wall-clock time of generate over the range, repeating small ranges
+    until min_time seconds have been spent.
+    """
+    best = None
+    spent = 0.0
+    while spent < min_time or best is None:
+        t0 = time.perf_counter()
+        generate(start_date, end_date)
+        elapsed = time.perf_counter() - t0
+        spent += elapsed
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _peak_memory(generate, start_date, end_date):
+    tracemalloc.start()
+    try:
+        result = generate(start_date, end_date)
+        peak = tracemalloc.get_traced_memory()[1]
+        del result
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run(implementations, sizes, budget=5.0, min_time=0.2, memory=True):
+    """
+    Times (and optionally memory-profiles) each implementation over each range size.
+    Sizes are skipped for an implementation once its last run took more than budget
+    seconds, since larger ranges would take even longer.
+    """
+    results = []
+    for impl in implementations:
+        try:
+            generate = IMPLEMENTATIONS[impl]()
+        except ImportError as e:
+            print(f"{impl:<8} skipped: {e}", file=sys.stderr)
+            continue
+        over_budget = False
+        for size in sizes:
+            days = SIZES[size]
+            if over_budget:
+                print(f"{impl:<8} {size:>7} skipped (over budget)", file=sys.stderr)
+                continue
+            end_date = START_DATE + datetime.timedelta(days=days - 1)
+            seconds = _time(generate, START_DATE, end_date, min_time)
+            result = {
+                "implementation": impl,
+                "size": size,
+                "days": days,
+                "seconds": seconds,
+                "days_per_sec": days / seconds,
+            }
+            if memory:
+                result["peak_bytes"] = _peak_memory(generate, START_DATE, end_date)
+                result["bytes_per_day"] = result["peak_bytes"] / days
+            results.append(result)
+            print(
+                f"{impl:<8} {size:>7} {seconds:10.4f} s {result['days_per_sec']:14,.0f} days/sec"
+                + (f" {result['bytes_per_day']:10.1f} B/day" if memory else ""),
+                file=sys.stderr,
+            )
+            over_budget = seconds > budget
+    return results
+
+
+def cli_startup_ms(runs=10):
+    """
+    Best wall-clock time, in milliseconds, of converting one date with the CLI
+    in a fresh interpreter.
+    """
+    command = [sys.executable, "-m", "calendario_perpetuo", "convert", "2025-12-22"]
+    best = None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+        elapsed = (time.perf_counter() - t0) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def check_regressions(report, baseline, threshold):
+    """
+    Returns a message for every (implementation, size) whose throughput dropped
+    by more than threshold (a fraction) from the baseline report, and for a
+    CLI startup time that grew by more than threshold.
+    """
+    results = report["results"]
+    previous = {(r["implementation"], r["size"]): r["days_per_sec"] for r in baseline["results"]}
+    failures = []
+    if "cli_startup_ms" in report and "cli_startup_ms" in baseline:
+        growth = report["cli_startup_ms"] / baseline["cli_startup_ms"] - 1
+        if growth > threshold:
+            failures.append(
+                f"cli startup: {report['cli_startup_ms']:.1f} ms, "
+                f"{growth:.0%} above baseline {baseline['cli_startup_ms']:.1f} ms"
+            )
+    for result in results:
+        key = (result["implementation"], result["size"])
+        if key not in previous:
+            continue
+        drop = 1 - result["days_per_sec"] / previous[key]
+        if drop > threshold:
+            failures.append(
+                f"{key[0]} {key[1]}: {result['days_per_sec']:,.0f} days/sec, "
+                f"{drop:.0%} below baseline {previous[key]:,.0f}"
+            )
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the perpetual calendar generators.")
+    parser.add_argument("--implementations", nargs="+", default=list(IMPLEMENTATIONS), choices=list(IMPLEMENTATIONS))
+    parser.add_argument("--sizes", nargs="+", default=list(SIZES), choices=list(SIZES))
+    parser.add_argument("--budget", type=float, default=5.0,
+                        help="skip larger sizes once a run takes longer than this many seconds")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--no-startup", action="store_true", help="skip timing the CLI startup")
+    parser.add_argument("--output", default="-", help="JSON report path (default: stdout)")
+    parser.add_argument("--baseline", help="previous JSON report to compare throughput against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="fail when throughput drops by more than this fraction (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    results = run(args.implementations, args.sizes, args.budget, memory=not args.no_memory)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "start_date": START_DATE.isoformat(),
+        "results": results,
+    }
+    if not args.no_startup:
+        report["cli_startup_ms"] = cli_startup_ms()
+        print(f"cli startup {report['cli_startup_ms']:.1f} ms", file=sys.stderr)
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = check_regressions(report, json.load(f), args.threshold)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
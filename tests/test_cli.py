@@ -0,0 +1,24 @@
+from calendario_perpetuo.cli import main
+
+
+def test_convert(capsys):
+    assert main(["convert", "2025-12-22"]) == 0
+    assert capsys.readouterr().out == "2025-12-22  Solis, Florea Week 1 (2026)\n"
+
+
+def test_dump_rejects_solstice(capsys):
+    assert main(["--solstice", "Europe/Madrid", "dump", "2025-12-20", "2025-12-23"]) == 2
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == "error: --solstice is not supported by dump\n"
+
+
+def test_unwritable_output_is_an_error(tmp_path, capsys):
+    output = tmp_path / "missing" / "calendar.csv"
+    assert main(["dump", "2025-12-21", "2025-12-22", "--format", "csv", "--output", str(output)]) == 2
+    assert capsys.readouterr().err.startswith("error: ")
+
+
+def test_unwritable_profile_is_an_error(tmp_path, capsys):
+    assert main(["--profile", str(tmp_path / "missing" / "stats.json"), "convert", "2025-12-22"]) == 2
+    assert capsys.readouterr().err.startswith("error: ")
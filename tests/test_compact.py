@@ -0,0 +1,35 @@
+import datetime
+import pickle
+
+import pytest
+
+from calendario_perpetuo.compact import PerpetualColumns, PerpetualDay
+
+
+def test_columns_match_day_records():
+    start_date, end_date = datetime.date(2027, 12, 1), datetime.date(2029, 1, 10)
+    columns = PerpetualColumns(start_date, end_date)
+    assert len(columns) == end_date.toordinal() - start_date.toordinal() + 1
+    for index, day in enumerate(columns):
+        assert day == PerpetualDay.from_date(start_date + datetime.timedelta(days=index))
+
+
+def test_day_records_are_hashable():
+    date = datetime.date(2028, 6, 21)
+    same, other = PerpetualDay.from_date(date), PerpetualDay.from_date(date + datetime.timedelta(days=1))
+    assert hash(same) == hash(PerpetualDay.from_date(date))
+    assert len({same, PerpetualDay.from_date(date), other}) == 2
+    assert {same: "Leap Day"}[PerpetualDay.from_date(date)] == "Leap Day"
+
+
+def test_day_records_are_immutable():
+    day = PerpetualDay.from_date(datetime.date(2028, 6, 21))
+    records = {day}
+    with pytest.raises(AttributeError):
+        day.season = 0
+    with pytest.raises(AttributeError):
+        del day.extra_day
+    with pytest.raises(AttributeError):
+        day.note = "solstice"
+    assert day in records
+    assert pickle.loads(pickle.dumps(day)) == day
@@ -0,0 +1,105 @@
+import datetime
+
+import pytest
+
+from calendario_perpetuo import (
+    LEAP_DAY, NO_EXTRA_DAY, YEAR_DAY, PerpetualRange, configure_layout_cache, from_perpetual,
+    from_perpetual_many, iter_perpetual_dates, layout_cache_info, to_perpetual,
+)
+from calendario_perpetuo.core import DEFAULT_LAYOUT_CACHE_SIZE
+
+
+def _dates(start_date, end_date):
+    return [datetime.date.fromordinal(ordinal) for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1)]
+
+
+# Perpetual years 2028 (leap) and 2029 (common), with a day of the years around them
+ROUND_TRIP_DATES = _dates(datetime.date(2027, 12, 21), datetime.date(2029, 12, 22))
+
+
+def test_from_perpetual_round_trip():
+    for date in ROUND_TRIP_DATES:
+        assert from_perpetual(*to_perpetual(date)) == date
+
+
+def test_from_perpetual_many_round_trip():
+    perpetual_dates = [to_perpetual(date) for date in ROUND_TRIP_DATES]
+    assert from_perpetual_many(*zip(*perpetual_dates)) == ROUND_TRIP_DATES
+    regular = [p for p in perpetual_dates if p.extra_day == NO_EXTRA_DAY]
+    years, seasons, weeks_in_season, days, _ = zip(*regular)
+    assert from_perpetual_many(years, seasons, weeks_in_season, days) == [from_perpetual(*p) for p in regular]
+
+
+def test_extra_days():
+    assert from_perpetual(2028, extra_day=LEAP_DAY) == datetime.date(2028, 6, 21)
+    assert from_perpetual(2029, extra_day=YEAR_DAY) == datetime.date(2029, 12, 21)
+    with pytest.raises(ValueError):
+        from_perpetual(2029, extra_day=LEAP_DAY)
+    with pytest.raises(ValueError):
+        from_perpetual(2100, extra_day=LEAP_DAY)
+
+
+@pytest.mark.parametrize("season, week_in_season, day, extra_day", [
+    (4, 1, 0, NO_EXTRA_DAY),
+    (-1, 1, 0, NO_EXTRA_DAY),
+    (0, 0, 0, NO_EXTRA_DAY),
+    (0, 14, 0, NO_EXTRA_DAY),
+    (0, 1, 7, NO_EXTRA_DAY),
+    (0, 1, -1, NO_EXTRA_DAY),
+    (0, 1, None, NO_EXTRA_DAY),
+    (0, 1, 0, 3),
+])
+def test_from_perpetual_rejects_invalid_fields(season, week_in_season, day, extra_day):
+    with pytest.raises(ValueError):
+        from_perpetual(2029, season, week_in_season, day, extra_day)
+
+
+def test_from_perpetual_many_rejects_length_mismatch():
+    with pytest.raises(ValueError):
+        from_perpetual_many([2029, 2029], [0, 1], [1, 1], [0])
+    with pytest.raises(ValueError):
+        from_perpetual_many([2029], [0], [1], [0], [NO_EXTRA_DAY, NO_EXTRA_DAY])
+
+
+def test_perpetual_range_matches_generator():
+    start_date, end_date = datetime.date(2027, 12, 15), datetime.date(2028, 1, 20)
+    view = PerpetualRange(start_date, end_date)
+    expected = list(iter_perpetual_dates(start_date, end_date))
+    assert len(view) == len(expected) == 37
+    assert list(view) == expected
+    assert view[0] == expected[0]
+    assert view[-1] == expected[-1]
+    assert view[-37] == expected[0]
+    with pytest.raises(IndexError):
+        view[37]
+    with pytest.raises(IndexError):
+        view[-38]
+    for index in (slice(3, 20, 4), slice(None, None, -3), slice(-5, None), slice(10, 2), slice(40, 50)):
+        assert list(view[index]) == expected[index]
+        assert len(view[index]) == len(expected[index])
+    assert list(view[2:30][::5][1:]) == expected[2:30][::5][1:]
+
+
+def test_perpetual_range_entry():
+    start_date, end_date = datetime.date(2028, 6, 19), datetime.date(2028, 6, 23)
+    view = PerpetualRange(start_date, end_date, entry=to_perpetual)
+    assert list(view) == list(iter_perpetual_dates(start_date, end_date, entry=to_perpetual))
+    assert view[2].extra_day == LEAP_DAY
+    assert len(PerpetualRange(end_date, start_date)) == 0
+    assert list(PerpetualRange(end_date, start_date)) == []
+
+
+def test_layout_cache_is_bounded():
+    configure_layout_cache(maxsize=2)
+    try:
+        for year in (2025, 2026, 2027):
+            to_perpetual(datetime.date(year, 6, 1))
+        info = layout_cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (0, 3, 2, 2)
+        to_perpetual(datetime.date(2027, 3, 1)) # Still cached
+        to_perpetual(datetime.date(2025, 3, 1)) # Evicted by 2027
+        info = layout_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 4, 2)
+    finally:
+        configure_layout_cache()
+    assert layout_cache_info().maxsize == DEFAULT_LAYOUT_CACHE_SIZE
@@ -0,0 +1,97 @@
+import builtins
+import csv
+import datetime
+import io
+import itertools
+
+import pytest
+
+from calendario_perpetuo import LEAP_DAY, YEAR_DAY, export, parallel
+from calendario_perpetuo.compact import PerpetualColumns
+from calendario_perpetuo.export import ICS_LINE_OCTETS, export_range, export_schemes, render_chunk
+from calendario_perpetuo.parallel import export_range_parallel
+from calendario_perpetuo.names import CalendarNames
+
+AWKWARD_NAMES = CalendarNames(
+    ("Sol, \"el\" primero", "Luna;2", "Estrella\\3", "Tierra\n4", "Agua", "Aire", "Fuego"),
+    ("a,b", "Verano", "Otoño", "Invierno " + "ñ" * 60),
+    {YEAR_DAY: "Día del Año, fin", LEAP_DAY: "Día Bisiesto"},
+)
+
+COLUMNS = PerpetualColumns(datetime.date(2027, 12, 15), datetime.date(2028, 12, 31))
+
+
+def test_csv_quotes_names():
+    rows = list(csv.reader(io.StringIO(render_chunk(COLUMNS, "csv", AWKWARD_NAMES), newline="")))
+    assert len(rows) == len(COLUMNS)
+    assert {len(row) for row in rows} == {7}
+    by_date = {row[0]: row for row in rows}
+    assert by_date["2027-12-21"][6] == "Día del Año, fin"
+    assert by_date["2027-12-22"][3:6] == ["a,b", "1", "Sol, \"el\" primero"]
+    assert by_date["2027-12-25"][5] == "Tierra\n4"
+
+
+def _unfold(text):
+    return text.replace("\r\n ", "")
+
+
+def test_ics_escapes_and_folds():
+    text = render_chunk(COLUMNS, "ics", AWKWARD_NAMES)
+    for line in text.split("\r\n"):
+        assert len(line.encode("utf-8")) <= ICS_LINE_OCTETS
+    summaries = [line for line in _unfold(text).split("\r\n") if line.startswith("SUMMARY:")]
+    assert len(summaries) == len(COLUMNS)
+    assert "SUMMARY:Día del Año\\, fin (2027)" in summaries
+    assert "SUMMARY:Sol\\, \"el\" primero\\, a\\,b Week 1 (2028)" in summaries
+    assert "SUMMARY:Luna\\;2\\, a\\,b Week 1 (2028)" in summaries
+    assert "SUMMARY:Estrella\\\\3\\, a\\,b Week 1 (2028)" in summaries
+    assert "SUMMARY:Tierra\\n4\\, a\\,b Week 1 (2028)" in summaries
+    assert f"SUMMARY:Agua\\, Invierno {'ñ' * 60} Week 13 (2028)" in summaries
+
+
+def _dtstamps(text):
+    return {line for line in text.split("\r\n") if line.startswith("DTSTAMP:")}
+
+
+@pytest.fixture
+def ticking_clock(monkeypatch):
+    # A distinct timestamp on every call, as if each call came a second later
+    seconds = itertools.count()
+
+    def export_timestamp():
+        return f"20250101T{next(seconds):06d}Z"
+
+    monkeypatch.setattr(export, "export_timestamp", export_timestamp)
+    monkeypatch.setattr(parallel, "export_timestamp", export_timestamp)
+
+
+def test_ics_stamps_once_per_export(tmp_path, ticking_clock):
+    start_date, end_date = datetime.date(2025, 12, 1), datetime.date(2031, 12, 31)
+    serial, parallel_path = tmp_path / "serial.ics", tmp_path / "parallel.ics"
+    export_range(serial, start_date, end_date, "ics", chunk_days=100)
+    assert _dtstamps(serial.read_bytes().decode("utf-8")) == {"DTSTAMP:20250101T000000Z"}
+    export_range_parallel(parallel_path, start_date, end_date, "ics", workers=2, years_per_chunk=2, chunk_days=100)
+    parallel_text = parallel_path.read_bytes().decode("utf-8")
+    assert _dtstamps(parallel_text) == {"DTSTAMP:20250101T000001Z"}
+    assert parallel_text.replace("T000001Z", "T000000Z") == serial.read_bytes().decode("utf-8")
+
+    outputs = [("latin", tmp_path / "latin.ics"), ("neutral", tmp_path / "neutral.ics")]
+    export_schemes(outputs, start_date, end_date, "ics", chunk_days=100)
+    for _, path in outputs:
+        assert _dtstamps(path.read_bytes().decode("utf-8")) == {"DTSTAMP:20250101T000002Z"}
+
+
+def test_export_schemes_closes_files_when_an_open_fails(tmp_path, monkeypatch):
+    opened = []
+
+    def tracking_open(*args, **kwargs):
+        f = builtins.open(*args, **kwargs)
+        opened.append(f)
+        return f
+
+    monkeypatch.setattr(export, "open", tracking_open, raising=False)
+    outputs = [("latin", tmp_path / "latin.csv"), ("neutral", tmp_path / "missing" / "neutral.csv")]
+    with pytest.raises(OSError):
+        export_schemes(outputs, datetime.date(2025, 12, 20), datetime.date(2025, 12, 23))
+    assert len(opened) == 1
+    assert opened[0].closed
@@ -0,0 +1,120 @@
+import datetime
+import os
+import subprocess
+import sys
+
+import pytest
+
+from calendario_perpetuo.core import perpetual_year_of
+from calendario_perpetuo.entries import generate_perpetual_calendar_dates
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def baseline_bravo_generator(start_date, end_date):
+    """
+    The bravo generator as it was before the rewrite (comments trimmed), kept as
+    a reference oracle. It rescans every day since the Dec 22 anchor for Leap
+    Days, so it is quadratic in the length of a year.
+    """
+
+    latin_days = ["Solis", "Lunae", "Stellae", "Terrae", "Aquae", "Aeris", "Ignis"]
+    seasons = ["Alpha", "Beta", "Gamma", "Delta"] # Hemisphere-neutral season labels
+
+    perpetual_calendar_data = []
+
+    current_date = start_date
+
+    perpetual_start_anchor = datetime.date(2024, 12, 22) # Alpha, Week 1, Solis
+
+    while current_date <= end_date:
+        is_leap_year_gregorian = (current_date.year % 4 == 0 and current_date.year % 100 != 0) or (current_date.year % 400 == 0)
+
+        perpetual_day_name = None
+        perpetual_season = None
+        perpetual_week_in_season = None
+        perpetual_extra_day = False
+        perpetual_extra_day_type = None
+
+        if current_date.month == 12 and current_date.day == 21: # December Solstice (Year Day)
+            perpetual_extra_day = True
+            perpetual_extra_day_type = "Year Day (December Solstice)"
+            perpetual_start_anchor = current_date + datetime.timedelta(days=1)
+
+        elif is_leap_year_gregorian and current_date.month == 6 and current_date.day == 21: # June Solstice (Leap Day)
+            perpetual_extra_day = True
+            perpetual_extra_day_type = "Leap Day (June Solstice)"
+
+        if not perpetual_extra_day:
+            total_days_from_anchor = (current_date - perpetual_start_anchor).days
+
+            leap_days_to_subtract = 0
+            temp_date_for_leap_check = perpetual_start_anchor
+            while temp_date_for_leap_check < current_date:
+                if (temp_date_for_leap_check.month == 6 and temp_date_for_leap_check.day == 21 and
+                    (temp_date_for_leap_check.year % 4 == 0 and temp_date_for_leap_check.year % 100 != 0) or (temp_date_for_leap_check.year % 400 == 0)):
+                    leap_days_to_subtract += 1
+                temp_date_for_leap_check += datetime.timedelta(days=1)
+
+            days_into_cycle = (total_days_from_anchor - leap_days_to_subtract) % 364
+
+            perpetual_day_idx = days_into_cycle % 7
+            perpetual_day_name = latin_days[perpetual_day_idx]
+
+            perpetual_week_num_overall = (days_into_cycle // 7) + 1 # Weeks 1-52
+
+            perpetual_season_idx = (perpetual_week_num_overall - 1) // 13
+            perpetual_season = seasons[perpetual_season_idx]
+
+            perpetual_week_in_season = (perpetual_week_num_overall - 1) % 13 + 1
+
+        perpetual_calendar_data.append({
+            "current_date": current_date,
+            "std_weekday": current_date.strftime("%A"),
+            "std_date": current_date.strftime("%B %d, %Y"),
+            "perpetual_day_name": perpetual_day_name,
+            "perpetual_season": perpetual_season,
+            "perpetual_week_in_season": perpetual_week_in_season,
+            "perpetual_extra_day": perpetual_extra_day,
+            "perpetual_extra_day_type": perpetual_extra_day_type
+        })
+
+        current_date += datetime.timedelta(days=1)
+
+    return perpetual_calendar_data
+
+
+def _affected_by_precedence_bug(date):
+    # The baseline's Leap Day test reads `(... and year % 100 != 0) or (year % 400 == 0)`,
+    # so every day of Gregorian 2000 and 2400 counts as a Leap Day. Its rescan runs
+    # from the Dec 22 anchor, so the error spreads over the perpetual year holding
+    # those days: 2001 (from Dec 22, 2000) and 2400.
+    return date.year in (2000, 2400) or perpetual_year_of(date) in (2001, 2400)
+
+
+def test_neutral_generator_matches_baseline_2000_2400():
+    start_date = datetime.date(2000, 12, 21)
+    end_date = datetime.date(2400, 12, 21)
+    expected = baseline_bravo_generator(start_date, end_date)
+    actual = generate_perpetual_calendar_dates(start_date, end_date, "neutral")
+    assert len(actual) == len(expected)
+
+    compared = 0
+    for old, new in zip(expected, actual):
+        if _affected_by_precedence_bug(old["current_date"]):
+            continue
+        assert new == old, old["current_date"]
+        compared += 1
+    assert compared > 145000
+
+
+@pytest.mark.parametrize("script", ["alpha", "bravo", "charlie"])
+def test_script_output_2025_2029(script):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "scripts", f"{script}.py")],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    with open(os.path.join(DATA, f"{script}_2025_2029.txt")) as f:
+        assert result.stdout == f.read()
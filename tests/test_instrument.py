@@ -0,0 +1,33 @@
+import datetime
+import os
+import subprocess
+import sys
+import time
+
+from calendario_perpetuo import entries, instrument
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_render_entry_excludes_conversion(monkeypatch):
+    to_perpetual = entries.to_perpetual
+
+    def slow_to_perpetual(date):
+        time.sleep(0.002)
+        return to_perpetual(date)
+
+    monkeypatch.setattr(entries, "to_perpetual", slow_to_perpetual)
+    with instrument.profile() as stats:
+        entries.generate_perpetual_calendar_dates(datetime.date(2025, 12, 20), datetime.date(2025, 12, 24))
+    histograms = stats.snapshot["histograms"]
+    assert histograms["render.entry"]["count"] == 5
+    # The 10 ms spent converting are in generate.entries but not in render.entry
+    generate_seconds = histograms["generate.entries"]["total_seconds"]
+    assert generate_seconds >= 0.01
+    assert histograms["render.entry"]["total_seconds"] < generate_seconds / 2
+
+
+def test_package_import_does_not_load_json():
+    code = "import sys, calendario_perpetuo; print('json' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
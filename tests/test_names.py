@@ -0,0 +1,93 @@
+import datetime
+
+import pytest
+
+from calendario_perpetuo import LEAP_DAY, YEAR_DAY, names
+from calendario_perpetuo.export import export_range, export_schemes
+from calendario_perpetuo.names import CalendarNames, get_names, register_scheme, scheme_names
+
+SPANISH = CalendarNames(
+    ("Sol", "Luna", "Estrella", "Tierra", "Agua", "Aire", "Fuego"),
+    ("Flor", "Calor", "Fruto", "Frío"),
+    {YEAR_DAY: "Día del Año", LEAP_DAY: "Día Bisiesto"},
+)
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    # Schemes registered by a test are dropped afterwards
+    monkeypatch.setattr(names, "_SCHEMES", dict(names._SCHEMES))
+    get_names.cache_clear()
+    yield
+    get_names.cache_clear()
+
+
+def test_register_scheme():
+    register_scheme("spanish", SPANISH)
+    assert "spanish" in scheme_names()
+    assert get_names("spanish") is SPANISH
+
+
+def test_duplicate_scheme_is_an_error():
+    with pytest.raises(ValueError):
+        register_scheme("latin", SPANISH)
+    assert get_names("latin").season_names[0] == "Florea"
+
+
+def test_replace_clears_the_cache():
+    register_scheme("spanish", SPANISH)
+    assert get_names("spanish") is SPANISH
+    renamed = SPANISH._replace(season_names=("Primavera", "Verano", "Otoño", "Invierno"))
+    register_scheme("spanish", renamed, replace=True)
+    assert get_names("spanish") is renamed
+
+
+def test_lazy_scheme_is_validated_on_first_use():
+    calls = []
+
+    def build():
+        calls.append(None)
+        return SPANISH._replace(day_names=SPANISH.day_names[:6])
+
+    register_scheme("short", build)
+    assert calls == []
+    with pytest.raises(ValueError):
+        get_names("short")
+    assert calls == [None]
+
+
+def test_invalid_names_are_rejected_at_registration():
+    with pytest.raises(ValueError):
+        register_scheme("no-leap-day", SPANISH._replace(extra_day_labels={YEAR_DAY: "Día del Año"}))
+    assert "no-leap-day" not in scheme_names()
+
+
+def test_unknown_scheme_is_an_error():
+    with pytest.raises(ValueError):
+        get_names("missing")
+
+
+@pytest.mark.parametrize("format", ["csv", "text"])
+def test_export_schemes_matches_single_exports(tmp_path, format):
+    register_scheme("spanish", SPANISH)
+    start_date, end_date = datetime.date(2027, 12, 1), datetime.date(2028, 12, 31)
+    outputs = [
+        ("latin", tmp_path / "latin"),
+        ("spanish", tmp_path / "spanish"),
+        (get_names("constellation"), tmp_path / "constellation"),
+    ]
+    bytes_written = export_schemes(outputs, start_date, end_date, format, chunk_days=50)
+    for scheme, path in outputs:
+        expected = tmp_path / "expected"
+        export_range(expected, start_date, end_date, format, scheme)
+        assert path.read_bytes() == expected.read_bytes()
+        assert bytes_written[path] == len(expected.read_bytes())
+    assert "Fuego" in (tmp_path / "spanish").read_text(encoding="utf-8")
+
+
+def test_export_schemes_accepts_a_mapping(tmp_path):
+    start_date, end_date = datetime.date(2027, 12, 20), datetime.date(2027, 12, 23)
+    outputs = {"latin": tmp_path / "latin.csv", "neutral": tmp_path / "neutral.csv"}
+    export_schemes(outputs, start_date, end_date)
+    assert "Florea" in outputs["latin"].read_text(encoding="utf-8")
+    assert "Alpha" in outputs["neutral"].read_text(encoding="utf-8")
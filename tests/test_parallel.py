@@ -0,0 +1,39 @@
+import datetime
+import os
+
+import pytest
+
+from calendario_perpetuo.export import export_range
+from calendario_perpetuo.parallel import (
+    export_range_parallel, generate_parallel, iter_export_parallel, year_aligned_chunks,
+)
+
+START_DATE = datetime.date(2020, 1, 1)
+END_DATE = datetime.date(2080, 12, 31)
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_rejects_fewer_than_one_worker(workers):
+    with pytest.raises(ValueError):
+        iter_export_parallel(START_DATE, END_DATE, workers=workers)
+    with pytest.raises(ValueError):
+        generate_parallel(START_DATE, END_DATE, workers=workers)
+
+
+@pytest.mark.parametrize("years_per_chunk", [0, -1])
+def test_rejects_fewer_than_one_year_per_chunk(years_per_chunk):
+    with pytest.raises(ValueError):
+        year_aligned_chunks(START_DATE, END_DATE, years_per_chunk)
+    with pytest.raises(ValueError):
+        iter_export_parallel(START_DATE, END_DATE, years_per_chunk=years_per_chunk)
+    with pytest.raises(ValueError):
+        generate_parallel(START_DATE, END_DATE, workers=1, years_per_chunk=years_per_chunk)
+    with pytest.raises(ValueError):
+        export_range_parallel(os.devnull, START_DATE, END_DATE, workers=1, years_per_chunk=years_per_chunk)
+
+
+def test_parallel_export_matches_serial(tmp_path):
+    serial, parallel = tmp_path / "serial.csv", tmp_path / "parallel.csv"
+    export_range(serial, START_DATE, END_DATE, "csv", chunk_days=100)
+    export_range_parallel(parallel, START_DATE, END_DATE, "csv", workers=2, years_per_chunk=7, chunk_days=100)
+    assert parallel.read_bytes() == serial.read_bytes()
@@ -0,0 +1,103 @@
+import datetime
+
+import pytest
+
+from calendario_perpetuo import LEAP_DAY, NO_EXTRA_DAY, YEAR_DAY, to_perpetual
+from calendario_perpetuo.recurrence import Recurrence, expand, expand_many, expand_ordinals_many
+
+# Perpetual years 2024 (leap), 2100 (century, common) and 2400 (century, leap),
+# with a few days of the neighbouring years on each side
+WINDOWS = [
+    (datetime.date(2023, 12, 10), datetime.date(2025, 1, 5)),
+    (datetime.date(2099, 12, 1), datetime.date(2101, 1, 10)),
+    (datetime.date(2399, 12, 15), datetime.date(2400, 12, 31)),
+]
+
+RULES = [
+    Recurrence(),
+    Recurrence(days=4, weeks_in_season=3),
+    Recurrence(days={0, 6}, weeks_in_season=(1, 13), seasons=[1, 2]),
+    Recurrence(seasons=2, extra_days=(YEAR_DAY,)),
+    Recurrence(extra_days=YEAR_DAY),
+    Recurrence(extra_days=LEAP_DAY),
+    Recurrence(extra_days=(YEAR_DAY, LEAP_DAY)),
+]
+
+
+def _as_set(value, valid):
+    if value is None:
+        return set(valid)
+    return {value} if isinstance(value, int) else set(value)
+
+
+def scan(rule, start_date, end_date):
+    """
+    Day-by-day reference: the dates whose to_perpetual matches the rule.
+    """
+    extra_days = _as_set(rule.extra_days, ())
+    only_extra_days = (rule.days, rule.weeks_in_season, rule.seasons) == (None, None, None) and extra_days
+    days = set() if only_extra_days else _as_set(rule.days, range(7))
+    weeks = set() if only_extra_days else _as_set(rule.weeks_in_season, range(1, 14))
+    seasons = set() if only_extra_days else _as_set(rule.seasons, range(4))
+    dates = []
+    for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+        date = datetime.date.fromordinal(ordinal)
+        perpetual_date = to_perpetual(date)
+        if perpetual_date.extra_day != NO_EXTRA_DAY:
+            matched = perpetual_date.extra_day in extra_days
+        else:
+            matched = (
+                perpetual_date.day in days
+                and perpetual_date.week_in_season in weeks
+                and perpetual_date.season in seasons
+            )
+        if matched:
+            dates.append(date)
+    return dates
+
+
+@pytest.mark.parametrize("start_date, end_date", WINDOWS)
+def test_expand_matches_scan(start_date, end_date):
+    expected = [scan(rule, start_date, end_date) for rule in RULES]
+    assert expand_many(RULES, start_date, end_date) == expected
+    for rule, dates in zip(RULES, expected):
+        assert expand(rule, start_date, end_date) == dates
+
+
+def test_extra_days_only():
+    start_date, end_date = WINDOWS[2]
+    assert expand(Recurrence(extra_days=(YEAR_DAY, LEAP_DAY)), start_date, end_date) == [
+        datetime.date(2399, 12, 21), datetime.date(2400, 6, 21), datetime.date(2400, 12, 21),
+    ]
+    start_date, end_date = WINDOWS[1]
+    assert expand(Recurrence(extra_days=LEAP_DAY), start_date, end_date) == []
+
+
+def test_empty_window():
+    start_date, end_date = WINDOWS[0]
+    assert expand_many(RULES, end_date, start_date) == [[] for _ in RULES]
+
+
+@pytest.mark.parametrize("rule", [
+    Recurrence(days=7),
+    Recurrence(days=(0, -1)),
+    Recurrence(weeks_in_season=0),
+    Recurrence(weeks_in_season=14),
+    Recurrence(seasons=4),
+    Recurrence(extra_days=NO_EXTRA_DAY),
+])
+def test_rejects_out_of_range_values(rule):
+    start_date, end_date = WINDOWS[0]
+    with pytest.raises(ValueError):
+        expand(rule, start_date, end_date)
+
+
+def test_equal_rules_get_their_own_lists():
+    start_date, end_date = WINDOWS[0]
+    rules = [Recurrence(days=1), Recurrence(days=(1,))]
+    for expand_rules in (expand_many, expand_ordinals_many):
+        a, b = expand_rules(rules, start_date, end_date)
+        assert a == b
+        assert a is not b
+        a.clear()
+        assert b
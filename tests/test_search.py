@@ -0,0 +1,40 @@
+import datetime
+import itertools
+
+import pytest
+
+from calendario_perpetuo import LEAP_DAY, NO_EXTRA_DAY, YEAR_DAY, to_perpetual
+from calendario_perpetuo.search import Coincidence, _matches, find_coincidences
+
+START_DATE = datetime.date(1999, 6, 1)
+END_DATE = datetime.date(2009, 1, 15)
+
+
+@pytest.mark.parametrize("query", [
+    Coincidence(day=6, weekday=4),
+    Coincidence(season=2, week_in_season=13, day=0),
+    Coincidence(extra_day=LEAP_DAY, weekday=2),
+    Coincidence(extra_day=YEAR_DAY),
+    Coincidence(extra_day=NO_EXTRA_DAY, month=6, month_day=22),
+    Coincidence(weekday=4, month_day=13),
+    Coincidence(month=12),
+])
+def test_matches_day_by_day_scan(query):
+    expected = []
+    for ordinal in range(START_DATE.toordinal(), END_DATE.toordinal() + 1):
+        date = datetime.date.fromordinal(ordinal)
+        perpetual_date = to_perpetual(date)
+        if _matches(date, perpetual_date, query):
+            expected.append((date, perpetual_date))
+    assert list(find_coincidences(START_DATE, END_DATE, *query)) == expected
+
+
+def test_lazy_over_every_date():
+    matches = find_coincidences(datetime.date.min, datetime.date.max, extra_day=LEAP_DAY, weekday=6)
+    first = [date for date, _ in itertools.islice(matches, 3)]
+    assert all(date.month == 6 and date.day == 21 and date.weekday() == 6 for date in first)
+
+
+def test_rejects_out_of_range_fields():
+    with pytest.raises(ValueError):
+        find_coincidences(START_DATE, END_DATE, day=7)
@@ -0,0 +1,53 @@
+import datetime
+
+import pytest
+
+from calendario_perpetuo import NO_EXTRA_DAY, YEAR_DAY
+from calendario_perpetuo.solstice import (
+    DECEMBER, FIRST_YEAR, JUNE, LAST_YEAR, SolsticeCalendar, solstice, solstice_calendar,
+)
+
+
+@pytest.mark.parametrize("year, month, expected", [
+    (2024, JUNE, "2024-06-20T20:51"),
+    (2024, DECEMBER, "2024-12-21T09:20"),
+    (2025, DECEMBER, "2025-12-21T15:03"),
+])
+def test_solstice_instants(year, month, expected):
+    instant = solstice(year, month)
+    assert abs(instant - datetime.datetime.fromisoformat(expected + "+00:00")) <= datetime.timedelta(minutes=2)
+
+
+def test_round_trip_utc():
+    calendar = solstice_calendar()
+    first = datetime.date(FIRST_YEAR - 1, 12, 31).toordinal()
+    last = datetime.date(LAST_YEAR, 12, 1).toordinal()
+    for ordinal in range(first, last, 3):
+        date = datetime.date.fromordinal(ordinal)
+        assert calendar.from_perpetual(*calendar.to_perpetual(date)) == date
+
+
+def test_year_day_on_the_local_date():
+    # The 2025 December solstice is at 15:03 UTC on Dec 21: Dec 22 in Kiritimati (UTC+14)
+    kiritimati = solstice_calendar("Pacific/Kiritimati")
+    assert kiritimati.from_perpetual(2025, extra_day=YEAR_DAY) == datetime.date(2025, 12, 22)
+    assert kiritimati.to_perpetual(datetime.date(2025, 12, 22)).extra_day == YEAR_DAY
+    assert solstice_calendar().to_perpetual(datetime.date(2025, 12, 22)).year == 2026
+    # The 2024 one is at 09:20 UTC on Dec 21: Dec 20 in Honolulu (UTC-10)
+    honolulu = solstice_calendar("Pacific/Honolulu")
+    assert honolulu.from_perpetual(2024, extra_day=YEAR_DAY) == datetime.date(2024, 12, 20)
+    assert honolulu.to_perpetual(datetime.date(2024, 12, 21)) == (2025, 0, 1, 0, NO_EXTRA_DAY)
+
+
+def test_irregular_year_raises():
+    # Alaska moved from UTC+14:00 to UTC-10:00 in 1867, leaving perpetual year 1867 a day short
+    anchorage = SolsticeCalendar("America/Anchorage")
+    with pytest.raises(ValueError):
+        anchorage.year_layout(1867)
+    with pytest.raises(ValueError):
+        anchorage.to_perpetual(datetime.date(1867, 6, 1))
+    for year in (1866, 1868, 2025):
+        layout = anchorage.year_layout(year)
+        assert layout.year_day - layout.start + 1 in (365, 366)
+    date = datetime.date(2025, 12, 21)
+    assert anchorage.from_perpetual(*anchorage.to_perpetual(date)) == date
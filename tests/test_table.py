@@ -0,0 +1,65 @@
+import datetime
+
+import pytest
+
+from calendario_perpetuo import core, table
+from calendario_perpetuo.table import (
+    CYCLE_BASE_ORDINAL, CYCLE_DAYS, TABLE_MAGIC, CycleTable, build_table, open_table,
+)
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("table") / "cycle.bin")
+    build_table(path)
+    return path
+
+
+def _boundary_ordinals():
+    last = datetime.date.max.toordinal()
+    ordinals = {1, 2, 355, 356, last - 1, last}
+    for cycle in range(-1, 26):
+        boundary = CYCLE_BASE_ORDINAL + cycle * CYCLE_DAYS
+        ordinals.update(range(boundary - 3, boundary + 3))
+    return sorted(ordinal for ordinal in ordinals if 1 <= ordinal <= last)
+
+
+def test_matches_core(table_path):
+    with CycleTable(table_path) as cycle_table:
+        for ordinal in _boundary_ordinals() + list(range(CYCLE_BASE_ORDINAL, CYCLE_BASE_ORDINAL + CYCLE_DAYS, 37)):
+            date = datetime.date.fromordinal(ordinal)
+            assert cycle_table.to_perpetual(date) == core.to_perpetual(date), date
+
+
+def test_rejects_bad_files(table_path, tmp_path):
+    with open(table_path, "rb") as f:
+        data = f.read()
+    bad_files = {
+        "truncated.bin": data[:len(data) // 2],
+        "bad_magic.bin": b"NOTATBL\0" + data[len(TABLE_MAGIC):],
+        "empty.bin": b"",
+    }
+    for name, content in bad_files.items():
+        path = tmp_path / name
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            CycleTable(str(path))
+
+
+def test_missing_table_falls_back(tmp_path, monkeypatch):
+    assert open_table(str(tmp_path / "missing.bin")) is None
+    monkeypatch.setattr(table, "_default_table", None)
+    monkeypatch.setattr(table, "_default_table_loaded", True)
+    date = datetime.date(2028, 6, 21)
+    assert table.lookup_perpetual(date) == core.to_perpetual(date)
+
+
+def test_lookup_uses_the_table(table_path, monkeypatch):
+    cycle_table = open_table(table_path)
+    monkeypatch.setattr(table, "_default_table", cycle_table)
+    monkeypatch.setattr(table, "_default_table_loaded", True)
+    try:
+        date = datetime.date(2027, 12, 21)
+        assert table.lookup_perpetual(date) == core.to_perpetual(date)
+    finally:
+        cycle_table.close()
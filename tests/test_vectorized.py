@@ -0,0 +1,31 @@
+import datetime
+
+import pytest
+
+from calendario_perpetuo import instrument, to_perpetual
+
+np = pytest.importorskip("numpy")
+from calendario_perpetuo.vectorized import to_perpetual_array # noqa: E402
+
+
+def _expected(date):
+    perpetual_date = to_perpetual(date)
+    fields = [perpetual_date.season, perpetual_date.week_in_season, perpetual_date.day]
+    return [perpetual_date.year, *(-1 if value is None else value for value in fields), perpetual_date.extra_day]
+
+
+def test_matches_scalar_conversion():
+    first = datetime.date(1999, 12, 1).toordinal()
+    ordinals = np.arange(first, first + 3000)
+    result = to_perpetual_array(ordinals)
+    for index, ordinal in enumerate(ordinals.tolist()):
+        assert [int(field[index]) for field in result] == _expected(datetime.date.fromordinal(ordinal))
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+@pytest.mark.parametrize("text", ["2025-12-21", "2028-06-21", "2026-03-01"])
+def test_zero_dimensional_input(text, enabled, monkeypatch):
+    monkeypatch.setattr(instrument, "enabled", enabled)
+    result = to_perpetual_array(np.datetime64(text))
+    assert all(np.ndim(field) == 0 for field in result)
+    assert [int(field) for field in result] == _expected(datetime.date.fromisoformat(text))